@@ -7,8 +7,9 @@ Handles all LLM operations with retry logic, cost tracking, and caching
 import os
 import json
 import time
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from datetime import datetime
 from functools import wraps
 import hashlib
@@ -101,6 +102,8 @@ class LLMGenerator:
         self.total_input_tokens = 0
         self.total_output_tokens = 0
         self.total_cost = 0.0
+        # Guards the counters and ledger when calls run on worker threads
+        self._usage_lock = threading.Lock()
     
     def retry_on_failure(func):
         """Decorator for automatic retry with exponential backoff"""
@@ -159,31 +162,32 @@ class LLMGenerator:
     
     def _track_usage(self, input_tokens: int, output_tokens: int):
         """Track token usage and costs"""
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        
-        # Calculate cost
-        pricing = self.PRICING.get(self.model, self.PRICING["gpt-4o-mini"])
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-        total_cost = input_cost + output_cost
-        
-        self.total_cost += total_cost
-        
-        # Log to ledger
-        ledger_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "model": self.model,
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "input_cost": round(input_cost, 6),
-            "output_cost": round(output_cost, 6),
-            "total_cost": round(total_cost, 6),
-            "cumulative_cost": round(self.total_cost, 6)
-        }
-        
-        with open(self.ledger_file, 'a') as f:
-            f.write(json.dumps(ledger_entry) + '\n')
+        with self._usage_lock:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            
+            # Calculate cost
+            pricing = self.PRICING.get(self.model, self.PRICING["gpt-4o-mini"])
+            input_cost = (input_tokens / 1_000_000) * pricing["input"]
+            output_cost = (output_tokens / 1_000_000) * pricing["output"]
+            total_cost = input_cost + output_cost
+            
+            self.total_cost += total_cost
+            
+            # Log to ledger
+            ledger_entry = {
+                "timestamp": datetime.now().isoformat(),
+                "model": self.model,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "input_cost": round(input_cost, 6),
+                "output_cost": round(output_cost, 6),
+                "total_cost": round(total_cost, 6),
+                "cumulative_cost": round(self.total_cost, 6)
+            }
+            
+            with open(self.ledger_file, 'a') as f:
+                f.write(json.dumps(ledger_entry) + '\n')
         
         return total_cost
     
@@ -256,6 +260,51 @@ class LLMGenerator:
         
         return result
     
+    @retry_on_failure
+    def _open_stream(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float):
+        """Start a streaming completion (retried like generate)"""
+        return self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+    
+    def generate_stream(self,
+                        prompt: str,
+                        system_prompt: str = None,
+                        max_tokens: int = 500,
+                        temperature: float = None) -> Iterator[str]:
+        """
+        Stream a response from the LLM as it is decoded
+        
+        Responses are not cached; usage is tracked once the stream is fully read.
+        
+        Args:
+            prompt: User prompt
+            system_prompt: System instructions
+            max_tokens: Maximum response length
+            temperature: Override default temperature
+        
+        Yields:
+            Text chunks in arrival order
+        """
+        temperature = temperature or self.temperature
+        
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        stream = self._open_stream(messages, max_tokens, temperature)
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if chunk.usage:
+                self._track_usage(chunk.usage.prompt_tokens, chunk.usage.completion_tokens)
+    
     def generate_variations(self,
                            base_prompt: str,
                            num_variations: int = 5,
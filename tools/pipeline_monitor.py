@@ -4,14 +4,16 @@ Pipeline Monitor - Real-time monitoring dashboard for Stormlight Short productio
 Tracks Vertex AI jobs, asset processing, and pipeline health.
 """
 
+import importlib.util
 import json
+import math
+import os
+import re
 import time
-import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import asyncio
-import aiofiles
 from rich.console import Console
 from rich.table import Table
 from rich.live import Live
@@ -21,9 +23,106 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskPr
 from rich.text import Text
 import yaml
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # Not installed, or on Windows where uvloop is unsupported
+    UVLOOP_AVAILABLE = False
+
+# orjson decodes straight from bytes in C; stdlib json is the fallback
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# Optional SDKs probed once at import rather than on every health check
+GEMINI_AVAILABLE = _module_available("google.generativeai")
+LEGACY_GCP_AVAILABLE = (
+    _module_available("google.cloud.storage")
+    and _module_available("google.cloud.aiplatform")
+)
+
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Sync summary counters, e.g. "uploaded/updated=12, skipped=3"
+_SYNC_STATS_RE = re.compile(rb'uploaded/updated=(\d+)(?:[^\n]*?skipped=(\d+))?')
+
+# Dashboard icon per generation backend
+_API_EMOJI = {"gemini": "🔮", "vertex": "☁️"}
+
 console = Console()
 
+
+async def _read_bytes(path: Path) -> bytes:
+    """Read a small binary file off the event loop in a single thread hop"""
+    return await asyncio.to_thread(path.read_bytes)
+
+
+def _read_ledger_from(path: Path, offset: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Parse ledger records appended after offset, one line at a time.
+    
+    Returns the parsed records and the offset to resume from. Malformed
+    lines are skipped; an unterminated last line that does not parse yet is
+    treated as a write in progress and left for the next read.
+    """
+    entries = []
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for raw in f:
+            if raw.strip():
+                try:
+                    entries.append(_json_loads(raw))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    if not raw.endswith(b'\n'):
+                        break
+            offset += len(raw)
+    return entries, offset
+
+
+def _read_bytes_from(path: Path, offset: int) -> bytes:
+    """Read everything after offset"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        return f.read()
+
+
+def _short_job_id(job_id: str) -> str:
+    """Truncate long job IDs for the jobs table"""
+    return job_id[:12] + "..." if len(job_id) > 15 else job_id
+
+
+def _run(coro):
+    """Run a coroutine on uvloop when available, otherwise the default event loop"""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 class PipelineMonitor:
+    # Vertex AI cost per second of video, keyed on frame width
+    RATE_BY_WIDTH = {
+        3840: 0.15,   # 4K UHD
+        4096: 0.15,   # 4K DCI
+        1920: 0.075,  # 1080p
+        1280: 0.0375  # 720p
+    }
+    
+    # Parsed configs shared across instances, keyed on (path, mtime_ns)
+    _CONFIG_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    
     def __init__(self, project_root: Path = None):
         self.project_root = project_root or Path.cwd()
         self.config_path = self.project_root / "config" / "pipeline_config.yaml"
@@ -31,6 +130,7 @@ class PipelineMonitor:
         self.logs_dir = self.project_root / "00_docs"
         self.console = Console()
         self.refresh_interval = 5  # seconds
+        self.health_check_timeout = 5  # seconds
         
         # Load configuration
         self.config = self._load_config()
@@ -42,12 +142,110 @@ class PipelineMonitor:
         self.asset_counts = {}
         self.sync_status = {}
         
+        # Refresh caches keyed on mtime so unchanged files and directories
+        # are not re-scanned or re-parsed every tick
+        self._dir_cache: Dict[Tuple[str, Optional[str]], Tuple[int, int, List[str]]] = {}
+        self._job_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        
+        # Tail state for the append-only ledger and sync log: file identity,
+        # resume offset and what was parsed so far, so each tick only reads
+        # newly appended bytes
+        self._ledger_state: Optional[Tuple[Tuple[int, int, int], List[Dict[str, Any]]]] = None
+        self._sync_log_state: Optional[Tuple[Tuple[str, int, int], int, int]] = None
+        
+        # Dashboard layout tree (with its static header and footer), built on first
+        # use and reused every tick; the tables and panels in it are rebuilt per tick
+        self._layout: Optional[Layout] = None
+        
     def _load_config(self) -> Dict[str, Any]:
-        """Load pipeline configuration"""
-        if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
-        return {}
+        """Load pipeline configuration, reusing the parse while the file is unchanged"""
+        try:
+            st = os.stat(self.config_path)
+        except FileNotFoundError:
+            return {}
+        
+        key = (str(self.config_path), st.st_mtime_ns)
+        if key not in self._CONFIG_CACHE:
+            with open(self.config_path, 'rb') as f:
+                self._CONFIG_CACHE[key] = yaml.load(f, Loader=_YAML_LOADER)
+        return self._CONFIG_CACHE[key]
+    
+    def _scan_dir(self, path: str, suffix: Optional[str] = None) -> Tuple[int, List[str]]:
+        """Return (matching file count, subdirectory paths) for a directory.
+        
+        A suffix of None matches any file with an extension (the ``*.*`` glob).
+        The scan is reused for as long as the directory mtime is unchanged.
+        """
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return 0, []
+        
+        key = (path, suffix)
+        cached = self._dir_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+        
+        count = 0
+        subdirs = []
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file():
+                    matches = entry.name.endswith(suffix) if suffix else "." in entry.name
+                    if matches:
+                        count += 1
+                elif entry.is_dir():
+                    subdirs.append(entry.path)
+        
+        self._dir_cache[key] = (mtime_ns, count, subdirs)
+        return count, subdirs
+    
+    def _count_files(self, path: Path, suffix: Optional[str] = None, recursive: bool = False) -> int:
+        """Count files in a directory (and optionally its subdirectories)"""
+        count, subdirs = self._scan_dir(str(path), suffix)
+        if recursive:
+            count += sum(self._count_files(subdir, suffix, recursive) for subdir in subdirs)
+        return count
+    
+    def _iter_job_dirs(self):
+        """Yield (scene_name, job_dir_path) for every <scene>/<job> Vertex directory"""
+        _, scene_dirs = self._scan_dir(str(self.vertex_jobs_dir))
+        for scene_dir in scene_dirs:
+            _, job_dirs = self._scan_dir(scene_dir)
+            scene_name = os.path.basename(scene_dir)
+            for job_dir in job_dirs:
+                yield scene_name, job_dir
+    
+    async def _load_ledger_entries(self, ledger_path: Path) -> List[Dict[str, Any]]:
+        """Parse the prompt ledger, reading only what was appended since last time"""
+        st = os.stat(ledger_path)
+        entries: List[Dict[str, Any]] = []
+        offset = 0
+        if self._ledger_state:
+            (ino, mtime_ns, last_offset), cached = self._ledger_state
+            if ino == st.st_ino and st.st_size >= last_offset:
+                if st.st_size == last_offset and st.st_mtime_ns == mtime_ns:
+                    return cached
+                if st.st_size > last_offset:
+                    # Appended to since last read: keep what we have and tail the rest
+                    entries, offset = cached, last_offset
+        
+        new_entries, offset = await asyncio.to_thread(_read_ledger_from, ledger_path, offset)
+        entries.extend(new_entries)
+        self._ledger_state = ((st.st_ino, st.st_mtime_ns, offset), entries)
+        return entries
+    
+    async def _load_job_metadata(self, metadata_file: Path) -> Dict[str, Any]:
+        """Parse a Vertex job metadata file, reusing the cached parse while unchanged"""
+        st = os.stat(metadata_file)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = self._job_cache.get(metadata_file)
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        metadata = _json_loads(await _read_bytes(metadata_file))
+        self._job_cache[metadata_file] = (key, metadata)
+        return metadata
     
     async def get_video_generation_status(self) -> Dict[str, Any]:
         """Get status of all video generations (Gemini API + legacy Vertex AI)"""
@@ -61,63 +259,58 @@ class PipelineMonitor:
         # Check Gemini API generations from ledger
         ledger_path = self.project_root / "02_prompts" / "ledger.jsonl"
         if ledger_path.exists():
-            async with aiofiles.open(ledger_path, 'r') as f:
-                content = await f.read()
-                for line in content.strip().split('\n'):
-                    if line.strip():
-                        try:
-                            entry = json.loads(line)
-                            # Use the filename from the ledger entry
-                            video_filename = entry.get('filename', f"{entry['scene']}_take{entry['take']:02d}_{entry['timestamp']}.mp4")
-                            video_path = self.project_root / "04_flow_exports" / video_filename
-                            
-                            job_info = {
-                                "job_id": f"{entry['scene']}_take{entry['take']:02d}",
-                                "scene": entry['scene'],
-                                "timestamp": entry['timestamp'],
-                                "status": "completed" if video_path.exists() else "active",
-                                "cost": 0.15,  # Gemini API cost estimate per video
-                                "api": "gemini"
-                            }
-                            
-                            if job_info["status"] == "completed":
-                                jobs_status["completed"].append(job_info)
-                            else:
-                                jobs_status["active"].append(job_info)
-                            
-                            jobs_status["total_cost"] += job_info["cost"]
-                        except json.JSONDecodeError:
-                            continue
+            for entry in await self._load_ledger_entries(ledger_path):
+                # Use the filename from the ledger entry
+                video_filename = entry.get('filename', f"{entry['scene']}_take{entry['take']:02d}_{entry['timestamp']}.mp4")
+                video_path = self.project_root / "04_flow_exports" / video_filename
+                
+                job_info = {
+                    "job_id": f"{entry['scene']}_take{entry['take']:02d}",
+                    "scene": entry['scene'],
+                    "timestamp": entry['timestamp'],
+                    "status": "completed" if video_path.exists() else "active",
+                    "cost": 0.15,  # Gemini API cost estimate per video
+                    "api": "gemini"
+                }
+                
+                if job_info["status"] == "completed":
+                    jobs_status["completed"].append(job_info)
+                else:
+                    jobs_status["active"].append(job_info)
+                
+                jobs_status["total_cost"] += job_info["cost"]
         
         # Legacy Vertex AI jobs (if any exist)
         if self.vertex_jobs_dir.exists():
-            for scene_dir in self.vertex_jobs_dir.iterdir():
-                if scene_dir.is_dir():
-                    for job_dir in scene_dir.iterdir():
-                        if job_dir.is_dir():
-                            metadata_file = job_dir / "metadata" / "job_metadata.json"
-                            if metadata_file.exists():
-                                async with aiofiles.open(metadata_file, 'r') as f:
-                                    content = await f.read()
-                                    metadata = json.loads(content)
-                                    
-                                    job_info = {
-                                        "job_id": job_dir.name,
-                                        "scene": scene_dir.name,
-                                        "timestamp": metadata.get("timestamp"),
-                                        "status": self._determine_job_status(job_dir),
-                                        "cost": self._calculate_job_cost(metadata),
-                                        "api": "vertex"
-                                    }
-                                    
-                                    if job_info["status"] == "completed":
-                                        jobs_status["completed"].append(job_info)
-                                    elif job_info["status"] == "failed":
-                                        jobs_status["failed"].append(job_info)
-                                    else:
-                                        jobs_status["active"].append(job_info)
-                                    
-                                    jobs_status["total_cost"] += job_info["cost"]
+            # Collect metadata files first so the reads can run concurrently
+            job_files = []
+            for scene_name, job_path in self._iter_job_dirs():
+                metadata_file = os.path.join(job_path, "metadata", "job_metadata.json")
+                if os.path.isfile(metadata_file):
+                    job_files.append((scene_name, Path(job_path), Path(metadata_file)))
+            
+            all_metadata = await asyncio.gather(
+                *(self._load_job_metadata(metadata_file) for _, _, metadata_file in job_files)
+            )
+            
+            for (scene_name, job_dir, _), metadata in zip(job_files, all_metadata):
+                job_info = {
+                    "job_id": job_dir.name,
+                    "scene": scene_name,
+                    "timestamp": metadata.get("timestamp"),
+                    "status": self._determine_job_status(job_dir),
+                    "cost": self._calculate_job_cost(metadata),
+                    "api": "vertex"
+                }
+                
+                if job_info["status"] == "completed":
+                    jobs_status["completed"].append(job_info)
+                elif job_info["status"] == "failed":
+                    jobs_status["failed"].append(job_info)
+                else:
+                    jobs_status["active"].append(job_info)
+                
+                jobs_status["total_cost"] += job_info["cost"]
         
         return jobs_status
     
@@ -139,13 +332,9 @@ class PipelineMonitor:
             duration = instances[0].get("duration", 5)
             resolution = instances[0].get("resolution", "1280x720")
             
-            # Pricing based on resolution
-            if "3840" in resolution or "4096" in resolution:
-                rate = 0.15  # 4K
-            elif "1920" in resolution:
-                rate = 0.075  # 1080p
-            else:
-                rate = 0.0375  # 720p
+            # Pricing based on frame width; anything unrecognised bills as 720p
+            width = resolution.split("x", 1)[0]
+            rate = self.RATE_BY_WIDTH.get(int(width), 0.0375) if width.isdigit() else 0.0375
             
             return duration * rate
         return 0.0
@@ -155,9 +344,9 @@ class PipelineMonitor:
         styleframes_dir = self.project_root / "01_styleframes_midjourney"
         
         # Count organized styleframes
-        start_frames = len(list((styleframes_dir / "start_frames").glob("**/*.jpg"))) if (styleframes_dir / "start_frames").exists() else 0
-        end_frames = len(list((styleframes_dir / "end_frames").glob("**/*.jpg"))) if (styleframes_dir / "end_frames").exists() else 0
-        reference_frames = len(list((styleframes_dir / "reference").glob("**/*.jpg"))) if (styleframes_dir / "reference").exists() else 0
+        start_frames = self._count_files(styleframes_dir / "start_frames", ".jpg", recursive=True)
+        end_frames = self._count_files(styleframes_dir / "end_frames", ".jpg", recursive=True)
+        reference_frames = self._count_files(styleframes_dir / "reference", ".jpg", recursive=True)
         
         counts = {
             "start_frames": start_frames,
@@ -165,10 +354,10 @@ class PipelineMonitor:
             "reference_frames": reference_frames,
             "total_styleframes": start_frames + end_frames + reference_frames,
             "prompts": self._count_ledger_entries(),
-            "vertex_jobs": len(list(self.vertex_jobs_dir.glob("*/*"))) if self.vertex_jobs_dir.exists() else 0,
-            "flow_exports": len(list((self.project_root / "04_flow_exports").glob("*.mp4"))),
-            "audio": len(list((self.project_root / "05_audio").glob("*.*"))),
-            "final_cuts": len(list((self.project_root / "06_final_cut").glob("*.*")))
+            "vertex_jobs": sum(1 for _ in self._iter_job_dirs()),
+            "flow_exports": self._count_files(self.project_root / "04_flow_exports", ".mp4"),
+            "audio": self._count_files(self.project_root / "05_audio"),
+            "final_cuts": self._count_files(self.project_root / "06_final_cut")
         }
         return counts
     
@@ -179,11 +368,32 @@ class PipelineMonitor:
             return 0
         
         try:
-            with open(ledger_path, 'r') as f:
-                return len([line for line in f if line.strip()])
+            with open(ledger_path, 'rb') as f:
+                return sum(1 for line in f if line.strip())
         except:
             return 0
     
+    async def _read_sync_stats(self, log_path: Path) -> Tuple[int, int]:
+        """Return (files_synced, files_skipped), scanning only bytes appended since last time"""
+        st = os.stat(log_path)
+        offset, synced, skipped = 0, 0, 0
+        if self._sync_log_state:
+            (path, ino, last_offset), last_synced, last_skipped = self._sync_log_state
+            if path == str(log_path) and ino == st.st_ino and st.st_size >= last_offset:
+                offset, synced, skipped = last_offset, last_synced, last_skipped
+        
+        if st.st_size > offset:
+            content = await asyncio.to_thread(_read_bytes_from, log_path, offset)
+            for match in _SYNC_STATS_RE.finditer(content):
+                synced = int(match[1])
+                if match[2] is not None:
+                    skipped = int(match[2])
+            # Resume after the last complete line; a partial line is rescanned next time
+            offset += content.rfind(b'\n') + 1
+        
+        self._sync_log_state = ((str(log_path), st.st_ino, offset), synced, skipped)
+        return synced, skipped
+    
     async def get_sync_status(self) -> Dict[str, Any]:
         """Get GCS sync status from logs"""
         sync_logs_dir = self.logs_dir / "sync_logs"
@@ -195,10 +405,16 @@ class PipelineMonitor:
         }
         
         if sync_logs_dir.exists():
-            # Find most recent sync log
-            logs = sorted(sync_logs_dir.glob("sync_*.log"), reverse=True)
-            if logs:
-                latest_log = logs[0]
+            # Find most recent sync log (timestamped names sort chronologically)
+            with os.scandir(sync_logs_dir) as it:
+                latest = max(
+                    (entry for entry in it
+                     if entry.name.startswith("sync_") and entry.name.endswith(".log")),
+                    key=lambda entry: entry.name,
+                    default=None
+                )
+            if latest:
+                latest_log = Path(latest.path)
                 # Extract timestamp from filename
                 timestamp_str = latest_log.stem.replace("sync_", "")
                 try:
@@ -206,17 +422,7 @@ class PipelineMonitor:
                     status["last_sync"] = sync_time.strftime("%Y-%m-%d %H:%M:%S")
                     
                     # Parse log for stats
-                    async with aiofiles.open(latest_log, 'r') as f:
-                        content = await f.read()
-                        lines = content.split('\n')
-                        for line in lines:
-                            if "uploaded/updated=" in line:
-                                parts = line.split(",")
-                                for part in parts:
-                                    if "uploaded/updated=" in part:
-                                        status["files_synced"] = int(part.split("=")[1])
-                                    elif "skipped=" in part:
-                                        status["files_skipped"] = int(part.split("=")[1])
+                    status["files_synced"], status["files_skipped"] = await self._read_sync_stats(latest_log)
                     
                     # Calculate next sync time (assuming hourly)
                     next_sync = sync_time + timedelta(hours=1)
@@ -226,9 +432,8 @@ class PipelineMonitor:
         
         return status
     
-    def create_dashboard_layout(self, jobs_status: Dict, asset_counts: Dict, 
-                               sync_status: Dict) -> Layout:
-        """Create rich dashboard layout"""
+    def _build_dashboard_layout(self) -> Layout:
+        """Build the layout tree, header and footer once; each refresh fills the empty slots"""
         layout = Layout()
         
         # Header with exit instructions
@@ -242,6 +447,46 @@ class PipelineMonitor:
             style="cyan"
         )
         
+        # Footer with controls
+        footer_text = Text()
+        footer_text.append("🔄 Auto-refresh: 5s  ", style="dim")
+        footer_text.append("⌨️  Ctrl+C: Exit  ", style="dim")
+        footer_text.append("📊 Status: Live", style="green")
+        
+        footer = Panel(footer_text, style="dim")
+        
+        # Layout assembly - create named layouts for proper rendering
+        layout.split_column(
+            Layout(header, size=4, name="header"),
+            Layout(name="body"),
+            Layout(footer, size=3, name="footer")
+        )
+        
+        # Split the body into two columns
+        layout["body"].split_row(
+            Layout(name="jobs"),
+            Layout(name="sidebar")
+        )
+        
+        # Split the sidebar into three panels
+        layout["body"]["sidebar"].split_column(
+            Layout(name="assets"),
+            Layout(name="sync"),
+            Layout(name="cost")
+        )
+        
+        return layout
+    
+    def create_dashboard_layout(self, jobs_status: Dict, asset_counts: Dict, 
+                               sync_status: Dict) -> Layout:
+        """Build this tick's tables and panels and swap them into the persistent layout"""
+        if self._layout is None:
+            self._layout = self._build_dashboard_layout()
+        
+        # Tables and panels are rebuilt every tick rather than mutated: Layout.update
+        # swaps them in under the layout lock, so Live's refresh thread never renders
+        # a half-updated table
+        
         # Jobs table
         jobs_table = Table(title="Video Generation Jobs", show_header=True, header_style="bold cyan")
         jobs_table.add_column("Scene", style="yellow")
@@ -249,33 +494,27 @@ class PipelineMonitor:
         jobs_table.add_column("API", style="blue")
         jobs_table.add_column("Status", style="green")
         jobs_table.add_column("Cost", style="red")
-        
-        for job in jobs_status["active"]:
-            api_emoji = "🔮" if job.get("api") == "gemini" else "☁️"
+        rows = [(job, "🔄 Active") for job in jobs_status["active"]]
+        rows += [(job, "✅ Complete") for job in jobs_status["completed"][-5:]]  # Last 5 completed
+        for job, status_label in rows:
+            api = job.get("api", "vertex")
             jobs_table.add_row(
-                job["scene"], 
-                job["job_id"][:12] + "..." if len(job["job_id"]) > 15 else job["job_id"], 
-                f"{api_emoji} {job.get('api', 'vertex').title()}",
-                "🔄 Active", 
-                f"${job['cost']:.2f}"
-            )
-        for job in jobs_status["completed"][-5:]:  # Last 5 completed
-            api_emoji = "🔮" if job.get("api") == "gemini" else "☁️"
-            jobs_table.add_row(
-                job["scene"], 
-                job["job_id"][:12] + "..." if len(job["job_id"]) > 15 else job["job_id"],
-                f"{api_emoji} {job.get('api', 'vertex').title()}",
-                "✅ Complete", 
+                job["scene"],
+                _short_job_id(job["job_id"]),
+                f"{_API_EMOJI.get(api, '☁️')} {api.title()}",
+                status_label,
                 f"${job['cost']:.2f}"
             )
         
+        self._layout["jobs"].update(jobs_table)
+        
         # Assets table
         assets_table = Table(title="Asset Inventory", show_header=True, header_style="bold green")
         assets_table.add_column("Category", style="yellow")
         assets_table.add_column("Count", style="cyan")
-        
         for category, count in asset_counts.items():
             assets_table.add_row(category.replace("_", " ").title(), str(count))
+        self._layout["assets"].update(assets_table)
         
         # Sync status panel
         sync_text = f"""
@@ -284,7 +523,7 @@ Files Synced: {sync_status['files_synced']}
 Files Skipped: {sync_status['files_skipped']}
 Next Sync: {sync_status['next_sync']}
         """
-        sync_panel = Panel(sync_text, title="GCS Sync Status", style="blue")
+        self._layout["sync"].update(Panel(sync_text, title="GCS Sync Status", style="blue"))
         
         # Cost summary
         cost_text = f"""
@@ -295,63 +534,53 @@ Failed: {len(jobs_status['failed'])}
 
 Total Cost: ${jobs_status['total_cost']:.2f}
         """
-        cost_panel = Panel(cost_text, title="Cost Summary", style="red")
-        
-        # Footer with controls
-        footer_text = Text()
-        footer_text.append("🔄 Auto-refresh: 5s  ", style="dim")
-        footer_text.append("⌨️  Ctrl+C: Exit  ", style="dim")
-        footer_text.append("📊 Status: Live", style="green")
+        self._layout["cost"].update(Panel(cost_text, title="Cost Summary", style="red"))
         
-        footer = Panel(footer_text, style="dim")
-        
-        # Layout assembly - create named layouts for proper rendering
-        layout.split_column(
-            Layout(header, size=4, name="header"),
-            Layout(name="body"),
-            Layout(footer, size=3, name="footer")
-        )
-        
-        # Split the body into two columns
-        layout["body"].split_row(
-            Layout(jobs_table, name="jobs"),
-            Layout(name="sidebar")
-        )
-        
-        # Split the sidebar into three panels
-        layout["body"]["sidebar"].split_column(
-            Layout(assets_table, name="assets"),
-            Layout(sync_panel, name="sync"),
-            Layout(cost_panel, name="cost")
-        )
-        
-        return layout
+        return self._layout
     
     async def run_dashboard(self):
         """Run the live monitoring dashboard"""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tick = 0
+        
+        async def sleep_until_next_tick():
+            # Refresh on a fixed cadence from start so the time spent gathering
+            # data does not add to the period; ticks a slow refresh overran are skipped
+            nonlocal tick
+            if self.refresh_interval <= 0:
+                # No cadence to keep (e.g. --refresh 0); just yield and go again
+                await asyncio.sleep(0)
+                return
+            elapsed = loop.time() - start
+            tick = max(tick + 1, math.ceil(elapsed / self.refresh_interval))
+            await asyncio.sleep(max(0.0, start + tick * self.refresh_interval - loop.time()))
+        
         with Live(console=self.console, refresh_per_second=1) as live:
             while True:
                 try:
                     # Gather all monitoring data
-                    jobs_status = await self.get_video_generation_status()
-                    asset_counts = await self.get_asset_counts()
-                    sync_status = await self.get_sync_status()
+                    jobs_status, asset_counts, sync_status = await asyncio.gather(
+                        self.get_video_generation_status(),
+                        self.get_asset_counts(),
+                        self.get_sync_status()
+                    )
                     
                     # Create and update dashboard
                     layout = self.create_dashboard_layout(jobs_status, asset_counts, sync_status)
                     live.update(layout)
                     
-                    # Wait before refresh
-                    await asyncio.sleep(self.refresh_interval)
+                    # Wait for the next refresh tick
+                    await sleep_until_next_tick()
                     
                 except KeyboardInterrupt:
                     console.print("\n👋 [bold green]Pipeline Monitor stopped[/bold green] - Have a great day!")
                     break
                 except Exception as e:
                     console.print(f"[red]Error updating dashboard: {e}[/red]")
-                    await asyncio.sleep(self.refresh_interval)
+                    await sleep_until_next_tick()
     
-    def run_health_check(self) -> Dict[str, Any]:
+    async def run_health_check(self) -> Dict[str, Any]:
         """Run comprehensive health check of the pipeline"""
         health = {
             "timestamp": datetime.now().isoformat(),
@@ -361,16 +590,25 @@ Total Cost: ${jobs_status['total_cost']:.2f}
         
         # Check GCP authentication
         try:
-            result = subprocess.run(
-                ["gcloud", "auth", "list", "--format=json"],
-                capture_output=True, text=True
+            proc = await asyncio.create_subprocess_exec(
+                "gcloud", "auth", "list", "--format=json",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            if result.returncode == 0:
-                health["checks"]["gcp_auth"] = "✅ Authenticated"
-            else:
-                health["checks"]["gcp_auth"] = "❌ Not authenticated"
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=self.health_check_timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                health["checks"]["gcp_auth"] = f"⚠️ gcloud timed out after {self.health_check_timeout}s"
                 health["status"] = "warning"
-        except:
+            else:
+                if proc.returncode == 0:
+                    health["checks"]["gcp_auth"] = "✅ Authenticated"
+                else:
+                    health["checks"]["gcp_auth"] = "❌ Not authenticated"
+                    health["status"] = "warning"
+        except OSError:
             health["checks"]["gcp_auth"] = "❌ gcloud not found"
             health["status"] = "critical"
         
@@ -379,10 +617,10 @@ Total Cost: ${jobs_status['total_cost']:.2f}
             "00_docs", "01_styleframes_midjourney", "02_prompts",
             "03_vertex_jobs", "04_flow_exports", "05_audio", "06_final_cut"
         ]
-        missing_dirs = []
-        for dir_name in required_dirs:
-            if not (self.project_root / dir_name).exists():
-                missing_dirs.append(dir_name)
+        # One listing of the project root instead of a stat per directory
+        with os.scandir(self.project_root) as it:
+            present = {entry.name for entry in it if entry.is_dir()}
+        missing_dirs = [dir_name for dir_name in required_dirs if dir_name not in present]
         
         if missing_dirs:
             health["checks"]["directories"] = f"⚠️ Missing: {', '.join(missing_dirs)}"
@@ -391,15 +629,13 @@ Total Cost: ${jobs_status['total_cost']:.2f}
             health["checks"]["directories"] = "✅ All directories present"
         
         # Check Python dependencies
-        try:
-            import google.generativeai as genai
+        if GEMINI_AVAILABLE:
             health["checks"]["gemini_api"] = "✅ Gemini API available"
-        except ImportError:
+        else:
             health["checks"]["gemini_api"] = "❌ Missing google-generativeai"
             health["status"] = "critical"
         
         # Check Gemini API key
-        import os
         if os.getenv("GEMINI_API_KEY"):
             health["checks"]["api_key"] = "✅ Gemini API key set"
         else:
@@ -407,11 +643,9 @@ Total Cost: ${jobs_status['total_cost']:.2f}
             health["status"] = "warning" if health["status"] == "healthy" else health["status"]
         
         # Check legacy dependencies (optional)
-        try:
-            import google.cloud.storage
-            import google.cloud.aiplatform
+        if LEGACY_GCP_AVAILABLE:
             health["checks"]["legacy_gcp"] = "✅ Legacy GCP libs available"
-        except ImportError:
+        else:
             health["checks"]["legacy_gcp"] = "⚠️ Legacy GCP libs missing (optional)"
         
         # Check styleframe manager
@@ -439,9 +673,11 @@ Total Cost: ${jobs_status['total_cost']:.2f}
     
     async def run_status_report(self):
         """Run one-time status report"""
-        jobs_status = await self.get_video_generation_status()
-        asset_counts = await self.get_asset_counts()
-        sync_status = await self.get_sync_status()
+        jobs_status, asset_counts, sync_status = await asyncio.gather(
+            self.get_video_generation_status(),
+            self.get_asset_counts(),
+            self.get_sync_status()
+        )
         
         console.print("\n📊 Pipeline Status Report\n", style="bold cyan")
         console.print(f"Video Jobs: {len(jobs_status['active'])} active, {len(jobs_status['completed'])} completed")
@@ -467,7 +703,7 @@ def main():
     monitor.refresh_interval = args.refresh
     
     if args.health_check:
-        health = monitor.run_health_check()
+        health = _run(monitor.run_health_check())
         console.print("\n🏥 Pipeline Health Check\n", style="bold cyan")
         
         status_color = "green" if health["status"] == "healthy" else "yellow" if health["status"] == "warning" else "red"
@@ -480,10 +716,10 @@ def main():
     elif args.dashboard:
         console.print("Starting Pipeline Monitor Dashboard...", style="bold green")
         console.print("Press Ctrl+C to exit\n")
-        asyncio.run(monitor.run_dashboard())
+        _run(monitor.run_dashboard())
     else:
         # Run one-time status report
-        asyncio.run(monitor.run_status_report())
+        _run(monitor.run_status_report())
 
 
 if __name__ == "__main__":
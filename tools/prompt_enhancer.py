@@ -4,26 +4,106 @@ Prompt Enhancer - Specialized prompt generation for Midjourney and Veo 3
 Tailored for Stormlight Archives animation in Arcane style
 """
 
+import os
 import json
-import yaml
+import hashlib
+import re
+import sqlite3
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, TypedDict
 from datetime import datetime
+from functools import lru_cache
+from contextlib import contextmanager
 
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 try:
-    from llm_generator import LLMGenerator
-    LLM_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    LLM_AVAILABLE = False
-    print("⚠️  LLM Generator not available. Some features will be disabled.")
+    ORJSON_AVAILABLE = False
+
+# numba is only probed here; it is imported when the semantic index is big enough to use it
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
 
 console = Console()
 
+# Below this many cached embeddings a plain BLAS matmul beats the numba kernel
+_NUMBA_MIN_ROWS = 64
+
+@lru_cache(maxsize=None)
+def _get_llm_cls():
+    """Import LLMGenerator on first use; None when it is unavailable"""
+    try:
+        from llm_generator import LLMGenerator
+    except ImportError:
+        print("⚠️  LLM Generator not available. Some features will be disabled.")
+        return None
+    return LLMGenerator
+
+@lru_cache(maxsize=None)
+def _get_similarity_kernel():
+    """Compile the numba best-match kernel on first use; None without numba"""
+    if not NUMBA_AVAILABLE:
+        return None
+    import numba
+    import numpy as np
+    
+    @numba.njit(parallel=True, fastmath=True)
+    def best_match(matrix, query):
+        # Dot products in parallel, then a serial argmax (no shared-state race)
+        n = matrix.shape[0]
+        sims = np.empty(n, dtype=np.float32)
+        for i in numba.prange(n):
+            s = np.float32(0.0)
+            for k in range(matrix.shape[1]):
+                s += matrix[i, k] * query[k]
+            sims[i] = s
+        best = 0
+        for i in range(1, n):
+            if sims[i] > sims[best]:
+                best = i
+        return best, sims[best]
+    
+    return best_match
+
+def _dump_json(obj: Any, path: Path, pretty: bool = True):
+    """Write obj as JSON, with orjson's C encoder when it is installed"""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2 if pretty else None)
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict:
+    """Parse a YAML config once per file version"""
+    import yaml
+    
+    # libyaml's C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=loader) or {}
+
+class MidjourneyPrompts(TypedDict, total=False):
+    """Midjourney enhancement result (a plain dict at runtime)"""
+    simple: str
+    detailed: str
+    artistic: str
+    workflow: str
+    parameters: str
+    note: str
+
+class VeoPrompts(TypedDict, total=False):
+    """Veo enhancement result (a plain dict at runtime)"""
+    prompt: str
+    simple: str
+    detailed: str
+    cost: float
+    metadata: Dict[str, Any]
+
 class PromptEnhancer:
     """Enhance and generate prompts for Midjourney and Veo 3"""
     
@@ -65,6 +145,80 @@ class PromptEnhancer:
         }
     }
     
+    # Palette rules in priority order: (keyword, match scene name, match description, palette)
+    _PALETTE_RULES = (
+        ("storm", True, True, "storm"),
+        ("battle", True, False, "battle"),
+        ("bridge", True, False, "battle"),
+        ("spren", False, True, "mystical")
+    )
+    
+    # One multi-keyword scan per text; the lookahead also reports overlapping keywords
+    _SCENE_PALETTE_RE = re.compile(
+        "(?=(" + "|".join(re.escape(rule[0]) for rule in _PALETTE_RULES if rule[1]) + "))"
+    )
+    _DESCRIPTION_PALETTE_RE = re.compile(
+        "(?=(" + "|".join(re.escape(rule[0]) for rule in _PALETTE_RULES if rule[2]) + "))"
+    )
+    
+    # Midjourney parameter suffixes and the prompt keys they are appended to
+    _PARAMS_STYLEREF = "--sw 300 --ar 16:9 --q 2"
+    _PARAMS_STANDARD = "--style raw --ar 16:9 --q 2 --no text"
+    _VARIATION_KEYS = ("simple", "detailed", "artistic")
+    
+    # Invariant system prompt text goes first and must stay byte-identical
+    # between calls, so providers that cache prompt prefixes can reuse it;
+    # per-call details are appended after it
+    _MJ_SYSTEM_PREFIX = """You are a Midjourney prompt specialist for Stormlight Archives animation.
+Create prompts in Arcane/Fortiche animation style.
+
+Guidelines:
+- Use clear, descriptive language
+- Avoid abstract concepts
+- Include specific visual details
+- Maintain Arcane animation style
+- No text or writing in scenes
+- Focus on composition and mood"""
+    
+    _VEO_SYSTEM_PREFIX = """You are a video prompt specialist for AI video generation.
+Create prompts for smooth, cinematic 8-second clips.
+
+Guidelines:
+- Describe motion and progression
+- Include camera movement
+- Specify lighting changes
+- Maintain visual continuity
+- Focus on smooth, realistic motion"""
+    
+    _BATCH_SYSTEM_PREFIX = """You are a prompt engineer for Midjourney style frames and Veo 3 video clips.
+Style: Arcane animated series aesthetic - painterly, dramatic lighting, rich colors.
+
+For each numbered input, write:
+- midjourney_simple: a concise visual prompt (under 60 words)
+- midjourney_detailed: a detailed visual prompt (under 100 words)
+- midjourney_artistic: an artistic interpretation (under 80 words)
+- veo_prompt: a cinematic 8-second clip prompt describing motion and camera movement
+
+Return ONLY a JSON array with one element per input, element i answering input [i+1],
+each element an object with exactly those four keys."""
+    
+    # Numbered or bulleted response line; "text" is the line with its list
+    # marker (digits, ".", "-", ")", spaces) and surrounding whitespace removed
+    _VARIATION_RE = re.compile(
+        r'^[^\S\n]*(?=[\d-])(?=(?P<marker>[0-9.\-) ]*))(?P=marker)'
+        r'[^\S\n]*(?P<text>\S.*?)[^\S\n]*$',
+        re.MULTILINE
+    )
+    
+    # Continuity analysis keywords, matched anywhere in the text ("colors" counts)
+    _CONTINUITY_RE = re.compile(r'lighting|color|style|suggest', re.IGNORECASE)
+    
+    # Default Veo camera movement for scene style descriptors, in priority order
+    _DESC_TO_CAMERA = {
+        "action": "tracking shot following action",
+        "massive": "dramatic pull back reveal"
+    }
+    
     # Camera movements for video generation
     CAMERA_MOVEMENTS = [
         "slow push in",
@@ -83,13 +237,35 @@ class PromptEnhancer:
         self.config_path = self.project_root / "config" / "pipeline_config.yaml"
         self.prompts_dir = self.project_root / "02_prompts"
         self.story_dir = self.project_root / "07_story_development"
+        self.cache_db = self.prompts_dir / "enhanced" / ".cache" / "enhancements.sqlite3"
+        
+        # SQLite store for parsed LLM enhancements and semantic embeddings, opened on first use
+        self._db = None
+        
+        # Full Arcane style suffix per color palette, built once
+        style_prefix = (f"{self.ARCANE_STYLE['visual']}, "
+                        f"dramatic {self.ARCANE_STYLE['lighting'].split(',')[0]}")
+        self._full_styles = {
+            name: f"{style_prefix}, color palette: {', '.join(colors[:3])}"
+            for name, colors in self.ARCANE_STYLE["color_palettes"].items()
+        }
+        
+        # Semantic cache: sentence embedder and per-kind (embeddings, cache keys)
+        # indexes, both loaded on first use
+        self._embedder = None
+        self._semantic_indexes = {}
         
         # Load configuration
         self.config = self._load_config()
         
+        # Per-scene config sections, rebuilt whenever self.config is replaced
+        self._scene_cfg_source = None
+        self._scene_cfg_cache = {}
+        
         # Initialize LLM if available
-        if LLM_AVAILABLE:
-            self.llm = LLMGenerator(project_root=self.project_root)
+        llm_cls = _get_llm_cls()
+        if llm_cls is not None:
+            self.llm = llm_cls(project_root=self.project_root)
         else:
             self.llm = None
             console.print("⚠️  Running without LLM enhancement", style="yellow")
@@ -97,16 +273,225 @@ class PromptEnhancer:
     def _load_config(self) -> Dict:
         """Load pipeline configuration"""
         if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return _load_config_cached(str(self.config_path), self.config_path.stat().st_mtime_ns)
         return {}
     
+    def _scene_cfg(self, scene_name: str) -> Dict:
+        """Config section for a scene ({} if it has none), memoized per config"""
+        if self._scene_cfg_source is not self.config:
+            self._scene_cfg_source = self.config
+            self._scene_cfg_cache = {}
+        try:
+            return self._scene_cfg_cache[scene_name]
+        except KeyError:
+            scene_config = (self.config.get("scenes") or {}).get(scene_name) or {}
+            self._scene_cfg_cache[scene_name] = scene_config
+            return scene_config
+    
+    def _cache_key(self,
+                   system_prompt: str,
+                   user_prompt: str,
+                   temperature: float,
+                   max_tokens: int) -> str:
+        """Build a deterministic key for an LLM request (whitespace-insensitive)"""
+        cache_data = {
+            "system_prompt": " ".join(system_prompt.split()),
+            "prompt": " ".join(user_prompt.split()),
+            "model": self.llm.model,
+            "temperature": temperature,
+            "max_tokens": max_tokens
+        }
+        cache_str = json.dumps(cache_data, sort_keys=True)
+        return hashlib.sha256(cache_str.encode()).hexdigest()
+    
+    def _cache_conn(self) -> sqlite3.Connection:
+        """Open the cache database on first use (WAL keeps readers and the writer apart)"""
+        if self._db is None:
+            self.cache_db.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.cache_db))
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript("""
+                CREATE TABLE IF NOT EXISTS enhancements (
+                    key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    model TEXT,
+                    temperature REAL,
+                    timestamp TEXT
+                );
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    id INTEGER PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    cache_key TEXT NOT NULL,
+                    vector BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS embeddings_by_kind ON embeddings (kind, id);
+            """)
+        return self._db
+    
+    def _cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached enhancement, or None on a miss"""
+        if not getattr(self.llm, "cache_enabled", True):
+            return None
+        row = self._cache_conn().execute(
+            "SELECT result FROM enhancements WHERE key = ?", (cache_key,)
+        ).fetchone()
+        if row is None:
+            return None
+        console.print("💾 Using cached enhancement", style="dim")
+        return json.loads(row[0])
+    
+    def _cache_put(self, cache_key: str, result: Dict[str, Any], temperature: float):
+        """Store a parsed enhancement"""
+        if not getattr(self.llm, "cache_enabled", True):
+            return
+        conn = self._cache_conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO enhancements VALUES (?, ?, ?, ?, ?)",
+                (cache_key, json.dumps(result), self.llm.model, temperature, datetime.now().isoformat())
+            )
+    
+    def clear_cache(self):
+        """Clear cached enhancements and their semantic embeddings"""
+        conn = self._cache_conn()
+        with conn:
+            conn.execute("DELETE FROM enhancements")
+            conn.execute("DELETE FROM embeddings")
+        self._semantic_indexes = {}
+    
+    def _semantic_settings(self) -> Dict[str, Any]:
+        """Semantic cache settings from the prompt_enhancer config section"""
+        return self.config.get("prompt_enhancer", {}) or {}
+    
+    def _get_embedder(self):
+        """Load the sentence embedder on first use; None when unavailable"""
+        if self._embedder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                console.print("⚠️  sentence-transformers not installed; semantic cache disabled", style="yellow")
+                self._embedder = False
+            else:
+                model_name = self._semantic_settings().get("embedding_model", "all-MiniLM-L6-v2")
+                self._embedder = SentenceTransformer(model_name)
+        return self._embedder or None
+    
+    def _semantic_enabled(self) -> bool:
+        """Whether near-duplicate prompts may reuse cached enhancements"""
+        if not self._semantic_settings().get("semantic_cache", False):
+            return False
+        return getattr(self.llm, "cache_enabled", True) and self._get_embedder() is not None
+    
+    def _semantic_index(self, kind: str):
+        """Load the (embeddings, cache keys) index for a kind of enhancement"""
+        if kind not in self._semantic_indexes:
+            import numpy as np
+            
+            rows = self._cache_conn().execute(
+                "SELECT cache_key, vector FROM embeddings WHERE kind = ? ORDER BY id", (kind,)
+            ).fetchall()
+            matrix, keys = None, []
+            if rows:
+                keys = [cache_key for cache_key, _ in rows]
+                matrix = np.frombuffer(b"".join(vector for _, vector in rows), dtype=np.float32)
+                matrix = matrix.reshape(len(rows), -1)
+            self._semantic_indexes[kind] = (matrix, keys)
+        return self._semantic_indexes[kind]
+    
+    def _semantic_lookup(self, kind: str, text: str):
+        """
+        Find the nearest previously enhanced prompt of the same kind
+        
+        Returns:
+            Tuple of (cache key of the match above the similarity threshold
+            or None, normalized query embedding)
+        """
+        import numpy as np
+        
+        normalized = " ".join(text.lower().split())
+        query = self._get_embedder().encode(normalized, normalize_embeddings=True).astype(np.float32)
+        
+        matrix, keys = self._semantic_index(kind)
+        if keys:
+            threshold = self._semantic_settings().get("semantic_threshold", 0.92)
+            kernel = _get_similarity_kernel() if len(keys) >= _NUMBA_MIN_ROWS else None
+            if kernel is not None:
+                best, score = kernel(matrix, query)
+            else:
+                sims = matrix @ query
+                best = int(sims.argmax())
+                score = sims[best]
+            if score >= threshold:
+                return keys[best], query
+        return None, query
+    
+    def _semantic_lookup_many(self, kind: str, texts: List[str]):
+        """
+        Batched _semantic_lookup: one encode call and one matmul for all texts
+        
+        Returns:
+            Tuple of (per-text cache key or None, (N, d) query embeddings)
+        """
+        import numpy as np
+        
+        normalized = [" ".join(text.lower().split()) for text in texts]
+        queries = self._get_embedder().encode(
+            normalized,
+            batch_size=min(32, len(normalized)),
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        ).astype(np.float32)
+        
+        matches = [None] * len(texts)
+        matrix, keys = self._semantic_index(kind)
+        if keys:
+            threshold = self._semantic_settings().get("semantic_threshold", 0.92)
+            sims = queries @ matrix.T
+            best = sims.argmax(axis=1)
+            best_scores = sims[np.arange(len(texts)), best]
+            for i in np.flatnonzero(best_scores >= threshold):
+                matches[i] = keys[best[i]]
+        return matches, queries
+    
+    def _semantic_add(self, kind: str, query, cache_key: str):
+        """Index a newly cached enhancement under its query embedding"""
+        self._semantic_add_many(kind, query[None, :], [cache_key])
+    
+    def _semantic_add_many(self, kind: str, queries, cache_keys: List[str]):
+        """Index several cached enhancements (rows of queries) in one write"""
+        import numpy as np
+        
+        matrix, keys = self._semantic_index(kind)
+        matrix = queries if matrix is None else np.vstack([matrix, queries])
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        keys = keys + list(cache_keys)
+        self._semantic_indexes[kind] = (matrix, keys)
+        
+        conn = self._cache_conn()
+        with conn:
+            conn.executemany(
+                "INSERT INTO embeddings (kind, cache_key, vector) VALUES (?, ?, ?)",
+                [(kind, cache_key, row.astype(np.float32).tobytes()) for cache_key, row in zip(cache_keys, queries)]
+            )
+    
+    def _select_palette(self, scene_name: str, base_description: str) -> str:
+        """Pick the color palette name for a scene (first matching keyword wins)"""
+        in_scene_name = set(self._SCENE_PALETTE_RE.findall(scene_name))
+        in_description = set(self._DESCRIPTION_PALETTE_RE.findall(base_description.lower()))
+        if not (in_scene_name or in_description):
+            return "desolate"
+        for keyword, scene_rule, description_rule, palette in self._PALETTE_RULES:
+            if (scene_rule and keyword in in_scene_name) or (description_rule and keyword in in_description):
+                return palette
+        return "desolate"
+    
     def enhance_midjourney_prompt(self,
                                  base_description: str,
                                  scene_name: str,
                                  frame_type: str = "start",
                                  use_llm: bool = True,
-                                 style_reference: bool = True) -> Dict[str, str]:
+                                 style_reference: bool = True) -> MidjourneyPrompts:
         """
         Enhance a prompt for Midjourney generation
         
@@ -121,31 +506,14 @@ class PromptEnhancer:
             Dictionary with enhanced prompts and workflow notes
         """
         # Get scene configuration
-        scene_config = self.config.get("scenes", {}).get(scene_name, {})
+        scene_config = self._scene_cfg(scene_name)
         style_descriptors = scene_config.get("style_descriptors", [])
         
         # Build base prompt with Arcane style
         if not style_reference:
-            # Full style prompt for initial generation
-            style_elements = [
-                self.ARCANE_STYLE["visual"],
-                "dramatic " + self.ARCANE_STYLE["lighting"].split(',')[0]
-            ]
-            
-            # Add scene-specific color palette
-            if "storm" in scene_name or "storm" in base_description.lower():
-                palette = self.ARCANE_STYLE["color_palettes"]["storm"]
-            elif "battle" in scene_name or "bridge" in scene_name:
-                palette = self.ARCANE_STYLE["color_palettes"]["battle"]
-            elif "spren" in base_description.lower():
-                palette = self.ARCANE_STYLE["color_palettes"]["mystical"]
-            else:
-                palette = self.ARCANE_STYLE["color_palettes"]["desolate"]
-            
-            style_elements.append(f"color palette: {', '.join(palette[:3])}")
-            full_style = ", ".join(style_elements)
-            
-            base_prompt = f"{base_description}, {full_style}"
+            # Full style prompt for initial generation, with scene-specific palette
+            palette = self._select_palette(scene_name, base_description)
+            base_prompt = f"{base_description}, {self._full_styles[palette]}"
         else:
             # Simple content prompt for style reference workflow
             base_prompt = base_description
@@ -169,18 +537,20 @@ class PromptEnhancer:
         # Add Midjourney parameters
         if style_reference:
             # V7 Style References workflow
+            params = self._PARAMS_STYLEREF
             enhanced["workflow"] = "V7_STYLE_REFERENCES"
-            enhanced["parameters"] = "--sw 300 --ar 16:9 --q 2"
+            enhanced["parameters"] = params
             enhanced["note"] = "Upload previous clip + start frame as Style References"
         else:
             # Standard generation
+            params = self._PARAMS_STANDARD
             enhanced["workflow"] = "STANDARD"
-            enhanced["parameters"] = "--style raw --ar 16:9 --q 2 --no text"
+            enhanced["parameters"] = params
         
         # Combine prompt with parameters
-        for key in ["simple", "detailed", "artistic"]:
+        for key in self._VARIATION_KEYS:
             if key in enhanced:
-                enhanced[key] = f"{enhanced[key]} {enhanced['parameters']}"
+                enhanced[key] = enhanced[key] + " " + params
         
         return enhanced
     
@@ -190,7 +560,7 @@ class PromptEnhancer:
                          duration: int = 8,
                          camera_movement: str = None,
                          mood: str = None,
-                         use_llm: bool = True) -> Dict[str, Any]:
+                         use_llm: bool = True) -> VeoPrompts:
         """
         Enhance a prompt for Veo 3 video generation
         
@@ -206,16 +576,15 @@ class PromptEnhancer:
             Dictionary with enhanced prompt and metadata
         """
         # Get scene configuration
-        scene_config = self.config.get("scenes", {}).get(scene_name, {})
+        scene_config = self._scene_cfg(scene_name)
         
         # Select camera movement if not specified
         if not camera_movement:
-            if "action" in scene_config.get("style_descriptors", []):
-                camera_movement = "tracking shot following action"
-            elif "massive" in scene_config.get("style_descriptors", []):
-                camera_movement = "dramatic pull back reveal"
-            else:
-                camera_movement = "slow push in"
+            descriptors = scene_config.get("style_descriptors", ())
+            camera_movement = next(
+                (camera for descriptor, camera in self._DESC_TO_CAMERA.items() if descriptor in descriptors),
+                "slow push in"
+            )
         
         # Build video prompt with temporal elements
         temporal_elements = [
@@ -257,67 +626,109 @@ class PromptEnhancer:
         
         return enhanced
     
+    @contextmanager
+    def _progress(self, description: str, total: int):
+        """Transient spinner yielding an advance() callback; silent when not on a terminal"""
+        if not console.is_terminal or os.getenv("PROMPT_ENHANCER_QUIET"):
+            yield lambda: None
+            return
+        
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True
+        ) as progress:
+            task = progress.add_task(description, total=total)
+            yield lambda: progress.advance(task)
+    
+    def _stream_variations(self,
+                           system_prompt: str,
+                           user_prompt: str,
+                           temperature: float,
+                           max_tokens: int):
+        """Yield numbered/bulleted response lines as they finish streaming"""
+        buffer = ""
+        for chunk in self.llm.generate_stream(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature
+        ):
+            buffer += chunk
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                match = self._VARIATION_RE.match(line)
+                if match:
+                    yield match.group("text")
+        
+        match = self._VARIATION_RE.match(buffer)
+        if match:
+            yield match.group("text")
+    
     def _enhance_with_llm(self,
                          base_prompt: str,
                          scene_name: str,
                          frame_type: str,
-                         style_descriptors: List[str]) -> Dict[str, str]:
+                         style_descriptors: List[str]) -> MidjourneyPrompts:
         """Use LLM to enhance Midjourney prompt"""
         
-        system_prompt = f"""You are a Midjourney prompt specialist for Stormlight Archives animation.
-        Create prompts in Arcane/Fortiche animation style.
+        system_prompt = (
+            f"{self._MJ_SYSTEM_PREFIX}\n\n"
+            f"Scene: {scene_name}\n"
+            f"Frame Type: {frame_type}\n"
+            f"Style Keywords: {', '.join(style_descriptors)}"
+        )
         
-        Scene: {scene_name}
-        Frame Type: {frame_type}
-        Style Keywords: {', '.join(style_descriptors)}
+        user_prompt = f"Create 3 prompt variations for: {base_prompt}"
+        temperature = 0.7
+        max_tokens = 400
         
-        Guidelines:
-        - Use clear, descriptive language
-        - Avoid abstract concepts
-        - Include specific visual details
-        - Maintain Arcane animation style
-        - No text or writing in scenes
-        - Focus on composition and mood"""
+        cache_key = self._cache_key(system_prompt, user_prompt, temperature, max_tokens)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Generate variations
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-        ) as progress:
-            task = progress.add_task(f"Enhancing {frame_type} frame prompt...", total=1)
-            
-            response = self.llm.generate(
-                prompt=f"Create 3 prompt variations for: {base_prompt}",
-                system_prompt=system_prompt,
-                max_tokens=400,
-                temperature=0.7
+        # Near-duplicate wording of an already enhanced prompt reuses that result
+        query = None
+        if self._semantic_enabled():
+            match_key, query = self._semantic_lookup(
+                "midjourney", f"{scene_name} {frame_type} {base_prompt}"
             )
-            
-            progress.update(task, completed=1)
+            if match_key is not None:
+                cached = self._cache_get(match_key)
+                if cached is not None:
+                    return cached
         
-        # Parse response into variations
-        lines = response["content"].split('\n')
         prompts = {
             "simple": base_prompt,
             "detailed": "",
             "artistic": ""
         }
         
-        variation_count = 0
-        for line in lines:
-            line = line.strip()
-            if line and (line[0].isdigit() or line.startswith('-')):
-                clean_line = line.lstrip('0123456789.-) ').strip()
-                if clean_line:
-                    if variation_count == 0:
-                        prompts["simple"] = clean_line
-                    elif variation_count == 1:
-                        prompts["detailed"] = clean_line
-                    elif variation_count == 2:
-                        prompts["artistic"] = clean_line
-                    variation_count += 1
+        # Generate variations, filling each one as soon as it is parsed
+        with self._progress(f"Enhancing {frame_type} frame prompt...", len(self._VARIATION_KEYS)) as advance:
+            if hasattr(self.llm, "generate_stream"):
+                variations = self._stream_variations(system_prompt, user_prompt, temperature, max_tokens)
+            else:
+                response = self.llm.generate(
+                    prompt=user_prompt,
+                    system_prompt=system_prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    use_cache=False  # Cached above in the enhancement store
+                )
+                variations = (m.group("text") for m in self._VARIATION_RE.finditer(response["content"]))
+            
+            for key, line in zip(self._VARIATION_KEYS, variations):
+                prompts[key] = line
+                advance()
+            
+            # Read the rest of the stream so its token usage is recorded
+            for _ in variations:
+                pass
         
         # Ensure we have all variations
         if not prompts["detailed"]:
@@ -325,13 +736,16 @@ class PromptEnhancer:
         if not prompts["artistic"]:
             prompts["artistic"] = prompts["simple"] + ", painterly style"
         
+        self._cache_put(cache_key, prompts, temperature)
+        if query is not None:
+            self._semantic_add("midjourney", query, cache_key)
         return prompts
     
     def _enhance_manually(self,
                          base_prompt: str,
                          scene_name: str,
                          frame_type: str,
-                         style_descriptors: List[str]) -> Dict[str, str]:
+                         style_descriptors: List[str]) -> MidjourneyPrompts:
         """Manual enhancement without LLM"""
         
         # Add style descriptors
@@ -355,37 +769,152 @@ class PromptEnhancer:
                                base_description: str,
                                scene_name: str,
                                temporal_elements: List[str],
-                               mood: str) -> Dict[str, str]:
+                               mood: str) -> VeoPrompts:
         """Use LLM to enhance video prompt"""
         
-        system_prompt = f"""You are a video prompt specialist for AI video generation.
-        Create prompts for smooth, cinematic 8-second clips.
+        system_prompt = (
+            f"{self._VEO_SYSTEM_PREFIX}\n\n"
+            f"Scene: {scene_name}\n"
+            f"Mood: {mood or 'dramatic'}"
+        )
         
-        Scene: {scene_name}
-        Mood: {mood or 'dramatic'}
+        user_prompt = f"Enhance this video prompt: {base_description}\nElements: {', '.join(temporal_elements)}"
+        temperature = 0.6
+        max_tokens = 800  # Increased from 200 to prevent truncation
         
-        Guidelines:
-        - Describe motion and progression
-        - Include camera movement
-        - Specify lighting changes
-        - Maintain visual continuity
-        - Focus on smooth, realistic motion"""
+        cache_key = self._cache_key(system_prompt, user_prompt, temperature, max_tokens)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            cached["cost"] = 0.0  # Served from cache, nothing spent
+            return cached
         
         response = self.llm.generate(
-            prompt=f"Enhance this video prompt: {base_description}\nElements: {', '.join(temporal_elements)}",
+            prompt=user_prompt,
             system_prompt=system_prompt,
-            max_tokens=800,  # Increased from 200 to prevent truncation
-            temperature=0.6
+            max_tokens=max_tokens,
+            temperature=temperature,
+            use_cache=False  # Cached above in the enhancement store
         )
         
         enhanced_prompt = response["content"].strip()
         
-        return {
+        enhanced = {
             "prompt": enhanced_prompt,
             "simple": base_description,
             "detailed": enhanced_prompt,
             "cost": response["cost"]
         }
+        self._cache_put(cache_key, enhanced, temperature)
+        return enhanced
+    
+    def _batch_enhance(self, prompts: List[str], scene_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Enhance several prompts for both Midjourney and Veo in a single LLM call
+        
+        With the semantic cache enabled, all prompts are embedded in one batch
+        and only those without a near-duplicate go to the LLM.
+        
+        Args:
+            prompts: Base descriptions, one per variation
+            scene_name: Scene identifier
+        
+        Returns:
+            One {"midjourney": {simple, detailed, artistic}, "veo": str} dict per
+            prompt, or None if the response could not be parsed
+        """
+        if not prompts:
+            return []
+        
+        temperature = 0.7
+        cache_key = self._cache_key(
+            f"{self._BATCH_SYSTEM_PREFIX}\n\nScene: {scene_name}",
+            "\n".join(prompts),
+            temperature,
+            400 * len(prompts)
+        )
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached["items"]
+        
+        results = [None] * len(prompts)
+        queries = None
+        if self._semantic_enabled():
+            match_keys, queries = self._semantic_lookup_many(
+                "variation", [f"{scene_name} {prompt}" for prompt in prompts]
+            )
+            for i, match_key in enumerate(match_keys):
+                if match_key is not None:
+                    entry = self._cache_get(match_key)
+                    if entry is not None:
+                        results[i] = entry["item"]
+        
+        misses = [i for i, item in enumerate(results) if item is None]
+        if misses:
+            batch = self._request_batch([prompts[i] for i in misses], scene_name, temperature)
+            if batch is None:
+                return None
+            for i, item in zip(misses, batch):
+                results[i] = item
+            
+            if queries is not None:
+                item_keys = [
+                    self._cache_key(self._BATCH_SYSTEM_PREFIX, f"{scene_name}\n{prompts[i]}", temperature, 400)
+                    for i in misses
+                ]
+                for item_key, item in zip(item_keys, batch):
+                    self._cache_put(item_key, {"item": item}, temperature)
+                self._semantic_add_many("variation", queries[misses], item_keys)
+        
+        self._cache_put(cache_key, {"items": results}, temperature)
+        return results
+    
+    def _request_batch(self,
+                       prompts: List[str],
+                       scene_name: str,
+                       temperature: float) -> Optional[List[Dict[str, Any]]]:
+        """Ask the LLM for numbered [1]..[N] enhancements and parse its JSON array"""
+        system_prompt = (
+            f"{self._BATCH_SYSTEM_PREFIX}\n\n"
+            f"Scene: {scene_name}\n"
+            f"Number of inputs: {len(prompts)}"
+        )
+        
+        user_prompt = "\n".join(f"[{i}] {prompt}" for i, prompt in enumerate(prompts, 1))
+        
+        response = self.llm.generate(
+            prompt=user_prompt,
+            system_prompt=system_prompt,
+            max_tokens=400 * len(prompts),
+            temperature=temperature,
+            use_cache=False  # Cached by _batch_enhance in the enhancement store
+        )
+        
+        content = response["content"].strip()
+        if content.startswith("```"):
+            content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
+        
+        try:
+            items = json.loads(content)
+            batch = [
+                {
+                    "midjourney": {
+                        "simple": item["midjourney_simple"],
+                        "detailed": item["midjourney_detailed"],
+                        "artistic": item["midjourney_artistic"]
+                    },
+                    "veo": item["veo_prompt"]
+                }
+                for item in items
+            ]
+        except (ValueError, TypeError, KeyError):
+            console.print("⚠️  Could not parse batched enhancement, using manual prompts", style="yellow")
+            return None
+        
+        if len(batch) != len(prompts):
+            console.print("⚠️  Batched enhancement returned the wrong number of prompts", style="yellow")
+            return None
+        
+        return batch
     
     def generate_scene_variations(self,
                                  scene_name: str,
@@ -403,7 +932,7 @@ class PromptEnhancer:
             List of variation dictionaries
         """
         # Get base scene configuration
-        scene_config = self.config.get("scenes", {}).get(scene_name, {})
+        scene_config = self._scene_cfg(scene_name)
         base_description = scene_config.get("description", "")
         default_prompts = scene_config.get("default_prompts", [])
         
@@ -420,17 +949,29 @@ class PromptEnhancer:
                 variation_type=variation_type
             )
             
+            # Optionally enhance every variation in one extra LLM request
+            batch = None
+            if self._semantic_settings().get("enhance_variations", False):
+                batch = self._batch_enhance(variation_prompts, scene_name)
+            
             for i, prompt in enumerate(variation_prompts):
+                midjourney = self.enhance_midjourney_prompt(
+                    prompt, scene_name, use_llm=False
+                )
+                veo = self.enhance_veo_prompt(
+                    prompt, scene_name, use_llm=False
+                )
+                if batch:
+                    for key in self._VARIATION_KEYS:
+                        midjourney[key] = f"{batch[i]['midjourney'][key]} {midjourney['parameters']}"
+                    veo["prompt"] = veo["detailed"] = batch[i]["veo"]
+                
                 variations.append({
                     "variation": i + 1,
                     "type": variation_type,
                     "prompt": prompt,
-                    "midjourney": self.enhance_midjourney_prompt(
-                        prompt, scene_name, use_llm=False
-                    ),
-                    "veo": self.enhance_veo_prompt(
-                        prompt, scene_name, use_llm=False
-                    )
+                    "midjourney": midjourney,
+                    "veo": veo
                 })
         else:
             # Manual variations
@@ -481,24 +1022,31 @@ class PromptEnhancer:
         issues = []
         suggestions = []
         
-        # Analyze each transition
-        for i in range(len(prompts) - 1):
-            result = self.llm.analyze_continuity(
-                prompts[i],
-                prompts[i + 1],
-                suggest_transition=suggest_fixes
-            )
-            
-            # Parse analysis for issues
-            if "lighting" in result["analysis"].lower():
+        # Transitions are independent, so overlap their LLM round-trips
+        transitions = range(len(prompts) - 1)
+        max_workers = max(1, min(self._semantic_settings().get("max_parallel_llm", 4), len(transitions)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda i: self.llm.analyze_continuity(
+                    prompts[i],
+                    prompts[i + 1],
+                    suggest_transition=suggest_fixes
+                ),
+                transitions
+            ))
+        
+        for i, result in enumerate(results):
+            # Parse analysis for issues in a single scan
+            found = {m.group(0).lower() for m in self._CONTINUITY_RE.finditer(result["analysis"])}
+            if "lighting" in found:
                 issues.append(f"Lighting inconsistency between scenes {i+1} and {i+2}")
-            if "color" in result["analysis"].lower():
+            if "color" in found:
                 issues.append(f"Color palette shift between scenes {i+1} and {i+2}")
-            if "style" in result["analysis"].lower():
+            if "style" in found:
                 issues.append(f"Style inconsistency between scenes {i+1} and {i+2}")
             
             # Extract suggestions
-            if suggest_fixes and "suggest" in result["analysis"].lower():
+            if suggest_fixes and "suggest" in found:
                 suggestions.append({
                     "transition": f"Scene {i+1} to {i+2}",
                     "suggestion": result["analysis"].split("suggest")[-1].strip()
@@ -514,14 +1062,14 @@ class PromptEnhancer:
     def save_enhanced_prompts(self,
                              scene_name: str,
                              prompts: Dict[str, Any],
-                             filename: str = None):
-        """Save enhanced prompts to file"""
+                             filename: str = None,
+                             pretty: bool = True):
+        """Save enhanced prompts to file (pretty=False writes compact JSON)"""
         filename = filename or f"{scene_name}_enhanced_prompts.json"
         filepath = self.prompts_dir / "enhanced" / filename
         filepath.parent.mkdir(exist_ok=True)
         
-        with open(filepath, 'w') as f:
-            json.dump(prompts, f, indent=2)
+        _dump_json(prompts, filepath, pretty=pretty)
         
         console.print(f"💾 Saved enhanced prompts: {filepath}")
     
@@ -529,6 +1077,8 @@ class PromptEnhancer:
                                    scene_name: str,
                                    results: Dict[str, Any]):
         """Display enhancement results in a formatted table"""
+        from rich.table import Table
+        
         table = Table(title=f"Enhanced Prompts for {scene_name}")
         table.add_column("Type", style="cyan")
         table.add_column("Prompt", style="white", overflow="fold")
@@ -556,6 +1106,8 @@ class PromptEnhancer:
 
 def main():
     """Test the prompt enhancer"""
+    from rich.panel import Panel
+    
     enhancer = PromptEnhancer()
     
     console.print(Panel.fit("🎨 Prompt Enhancer Test", style="bold cyan"))
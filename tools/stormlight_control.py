@@ -5,7 +5,9 @@ The ultimate visual control center for Stormlight: Into the Tempest production p
 """
 
 import asyncio
-import subprocess
+import io
+import os
+import signal
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -16,7 +18,7 @@ from rich.console import Console
 from rich.layout import Layout
 from rich.panel import Panel
 from rich.table import Table
-from rich.text import Text
+from rich.text import Span, Text
 from rich.align import Align
 from rich.columns import Columns
 from rich.live import Live
@@ -24,6 +26,42 @@ from rich.prompt import Prompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 import argparse
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    # Not installed, or on Windows where uvloop is unsupported
+    UVLOOP_AVAILABLE = False
+
+# orjson decodes straight from bytes in C; stdlib json is the fallback
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Unreadable or malformed status files (shape problems are raised as ValueError);
+# anything else is a bug and should surface
+_STATUS_READ_ERRORS = (OSError, ValueError)
+if IJSON_AVAILABLE:
+    _STATUS_READ_ERRORS += (ijson.JSONError,)
+
+
+def _run(coro):
+    """Run a coroutine on uvloop when available, otherwise the default event loop"""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
 console = Console()
 
 class StormlightControl:
@@ -32,8 +70,45 @@ class StormlightControl:
         self.console = Console()
         self.current_view = "main"
         self.tools_status = {}
+        # The API key does not change while the dashboard runs, so check it once
+        self._ai_available = bool(os.getenv('OPENAI_API_KEY'))
+        # Parsed status sources: path -> (stat signature, value)
+        self._status_cache = {}
+        # Video ledger tail: (inode, offset, [filename, ...], total cost)
+        self._ledger_state = None
+        # Names in 04_flow_exports, re-listed whenever the directory changes
+        self._exported = frozenset()
+        self._exports_signature = None
+        # (source signatures, probe results) from the last refresh
+        self._last_probes = None
+        # Static panels, layout tree and tool card text, built on first render
+        self._controls_panel = None
+        self._stats_panel = None
+        self._stats_cells = []
+        self._layout = None
+        self._card_parts = {}
+        self._logo = None
+        self._header_panel = None
+        # Off-screen console each frame is rendered into before one write to stdout
+        self._frame_buffer = io.StringIO()
+        self._frame_console = Console(
+            file=self._frame_buffer,
+            force_terminal=console.is_terminal,
+            color_system=console.color_system,
+        )
+        # (terminal size, status) -> rendered frame, reused while nothing changes
+        self._last_frame = None
+        # Terminal size, cached between SIGWINCH signals while run_interactive runs
+        self._term_size = None
+        self._track_resize = False
         
     def create_ascii_logo(self) -> Text:
+        """Return the ASCII art logo (built once, it never changes)"""
+        if self._logo is None:
+            self._logo = self._build_logo()
+        return self._logo
+    
+    def _build_logo(self) -> Text:
         """Create absolutely gorgeous ASCII art logo with gradients and emojis"""
         logo = Text()
         
@@ -91,111 +166,327 @@ class StormlightControl:
         
         return logo
     
-    def get_tool_status(self) -> Dict[str, Dict]:
-        """Get status of all tools"""
-        status = {}
-        
-        # Check AI status
-        import os
-        ai_available = bool(os.getenv('OPENAI_API_KEY'))
-        status['ai'] = {
-            'available': ai_available,
-            'status': '✅ Active' if ai_available else '⚠️ Not configured'
-        }
+    @staticmethod
+    def _stat_signature(path: Path):
+        """(mtime_ns, size) of a path, or None if it does not exist"""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _load_cached(self, path: Path, loader, *dependencies: Path):
+        """Return loader(path), re-running it only when path or a dependency changes on disk"""
+        signature = tuple(self._stat_signature(p) for p in (path,) + dependencies)
+        cached = self._status_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        value = loader(path)
+        self._status_cache[path] = (signature, value)
+        return value
+    
+    # Above this size the styleframes metadata is stream-counted instead of loaded
+    _STREAM_METADATA_BYTES = 1 << 20
+    _FRAME_KEYS = frozenset(('start', 'end', 'reference'))
+    
+    @staticmethod
+    def _read_styleframes(path: Path):
+        """Scene and frame counts from the styleframes metadata"""
+        if IJSON_AVAILABLE and path.stat().st_size > StormlightControl._STREAM_METADATA_BYTES:
+            return StormlightControl._stream_styleframes(path)
+        
+        metadata = _json_loads(path.read_bytes())
+        if not isinstance(metadata, dict):
+            raise ValueError("Styleframes metadata is not an object")
+        # Flat loop with local lookups; () defaults avoid allocating a list per miss
+        _len, _get = len, dict.get
+        total_frames = 0
+        for scene_data in metadata.values():
+            if not isinstance(scene_data, dict):
+                raise ValueError("Styleframes scene entry is not an object")
+            start = _get(scene_data, 'start', ())
+            end = _get(scene_data, 'end', ())
+            reference = _get(scene_data, 'reference', ())
+            if not (isinstance(start, (list, tuple)) and isinstance(end, (list, tuple)) and
+                    isinstance(reference, (list, tuple))):
+                raise ValueError("Styleframes frame list is not an array")
+            total_frames += _len(start) + _len(end) + _len(reference)
+        return len(metadata), total_frames
+    
+    @staticmethod
+    def _stream_styleframes(path: Path):
+        """Scene and frame counts from parser events, without building the metadata dict"""
+        frame_keys = StormlightControl._FRAME_KEYS
+        scenes = frames = 0
+        containers = []  # 'map' / 'array' for each open container
+        key = None       # Current key inside a scene
+        with open(path, 'rb') as f:
+            for event, value in ijson.basic_parse(f):
+                depth = len(containers)
+                if event == 'map_key':
+                    if depth == 1:
+                        scenes += 1
+                    elif depth == 2:
+                        key = value
+                    continue
+                if event in ('end_map', 'end_array'):
+                    containers.pop()
+                    continue
+                # Any other event starts a value; check the shape, and count frame list items
+                if depth == 0 and event != 'start_map':
+                    raise ValueError("Styleframes metadata is not an object")
+                if depth == 1 and event != 'start_map':
+                    raise ValueError("Styleframes scene entry is not an object")
+                if depth == 2 and key in frame_keys and event != 'start_array':
+                    raise ValueError("Styleframes frame list is not an array")
+                if depth == 3 and key in frame_keys and containers[-1] == 'array':
+                    frames += 1
+                if event == 'start_map':
+                    containers.append('map')
+                elif event == 'start_array':
+                    containers.append('array')
+        return scenes, frames
+    
+    # Official Veo pricing per second, keyed by (fast model, audio)
+    _VEO_PRICE_PER_SECOND = {
+        (True, False): 0.25,   # Veo 3 Fast
+        (True, True): 0.40,
+        (False, False): 0.50,  # Standard Veo 3
+        (False, True): 0.75,
+    }
+    
+    def _read_ledger(self, path: Path):
+        """Completed/active job counts and estimated cost from the video ledger.
+        
+        The ledger is append-only, so only lines written since the last call
+        are parsed; a replaced or truncated file is read again from the start.
+        """
+        st = path.stat()
+        jobs, offset, total_cost = [], 0, 0
+        if self._ledger_state:
+            ino, last_offset, last_jobs, last_cost = self._ledger_state
+            if ino == st.st_ino and st.st_size >= last_offset:
+                jobs, offset, total_cost = last_jobs, last_offset, last_cost
+        
+        # Hoisted locals keep the per-entry loop free of attribute lookups
+        new_jobs = []
+        add_job = new_jobs.append
+        loads = _json_loads
+        price = self._VEO_PRICE_PER_SECOND
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for raw in f:
+                if raw.strip():
+                    try:
+                        entry = loads(raw)
+                    except ValueError:
+                        if not raw.endswith(b'\n'):
+                            break  # Write in progress; parse it next time
+                        raise
+                    if not isinstance(entry, dict):
+                        raise ValueError(f"Ledger entry is not an object at byte {offset}")
+                    get = entry.get
+                    if get('scene') != 'example':  # Skip example
+                        filename = get('filename', '')
+                        model = get('model', 'veo-3.0-fast-generate-preview')
+                        notes = get('notes', '')
+                        duration = get('duration', 8)
+                        if not (isinstance(filename, str) and isinstance(model, str) and
+                                isinstance(notes, str) and isinstance(duration, (int, float))):
+                            raise ValueError(f"Malformed ledger entry at byte {offset}")
+                        add_job(filename)
+                        # Audio comes from the new format or falls back to the notes
+                        fast = 'fast' in model.lower()
+                        audio = bool(get('generate_audio', False)) or "with audio" in notes.lower()
+                        total_cost += duration * price[fast, audio]
+                offset += len(raw)
+        jobs = jobs + new_jobs
+        self._ledger_state = (st.st_ino, offset, jobs, total_cost)
+        
+        # One directory listing instead of a stat per ledger entry
+        exports_dir = self.project_root / "04_flow_exports"
+        signature = self._stat_signature(exports_dir)
+        if signature != self._exports_signature:
+            try:
+                with os.scandir(exports_dir) as it:
+                    self._exported = frozenset(e.name for e in it)
+            except FileNotFoundError:
+                self._exported = frozenset()
+            self._exports_signature = signature
+        
+        completed = 0
+        for filename in jobs:
+            if filename and os.sep not in filename:
+                completed += filename in self._exported
+            else:
+                completed += (exports_dir / filename).exists()
         
-        # Styleframe Manager Status
+        return completed, len(jobs) - completed, total_cost
+    
+    def _styleframes_status(self) -> Dict:
+        """Styleframe Manager status"""
         styleframes_metadata = self.project_root / "01_styleframes_midjourney" / "styleframes_metadata.json"
-        if styleframes_metadata.exists():
-            try:
-                with open(styleframes_metadata, 'r') as f:
-                    metadata = json.load(f)
-                    scenes_count = len(metadata)
-                    total_frames = sum(len(scene_data.get('start', [])) + 
-                                     len(scene_data.get('end', [])) + 
-                                     len(scene_data.get('reference', [])) 
-                                     for scene_data in metadata.values())
-                    status['styleframes'] = {
-                        'status': '✅ Active',
-                        'scenes': scenes_count,
-                        'frames': total_frames,
-                        'health': 'healthy'
-                    }
-            except:
-                status['styleframes'] = {'status': '⚠️ Error', 'health': 'warning'}
-        else:
-            status['styleframes'] = {'status': '❌ Not Setup', 'health': 'critical'}
-        
-        # Video Generation Status
+        if not styleframes_metadata.exists():
+            return {'status': '❌ Not Setup', 'health': 'critical'}
+        try:
+            scenes_count, total_frames = self._load_cached(styleframes_metadata, self._read_styleframes)
+            return {
+                'status': '✅ Active',
+                'scenes': scenes_count,
+                'frames': total_frames,
+                'health': 'healthy'
+            }
+        except _STATUS_READ_ERRORS as e:
+            return {'status': f'⚠️ {type(e).__name__}', 'health': 'warning'}
+    
+    def _video_gen_status(self) -> Dict:
+        """Video Generation status"""
         ledger_path = self.project_root / "02_prompts" / "ledger.jsonl"
-        if ledger_path.exists():
-            try:
-                with open(ledger_path, 'r') as f:
-                    entries = [json.loads(line) for line in f if line.strip()]
-                    
-                completed = 0
-                active = 0
-                total_cost = 0
-                
-                for entry in entries:
-                    if entry.get('scene') == 'example':  # Skip example
-                        continue
-                    video_path = self.project_root / "04_flow_exports" / entry.get('filename', '')
-                    if video_path.exists():
-                        completed += 1
-                    else:
-                        active += 1
-                    # Cost estimation based on official Veo pricing (per second)
-                    duration = entry.get('duration', 8)  # Default 8 seconds
-                    model = entry.get('model', 'veo-3.0-fast-generate-preview')  # Default to fast model
-                    
-                    # Check for audio setting in new format or fallback to notes
-                    has_audio = entry.get('generate_audio', False)
-                    if not has_audio and "with audio" in entry.get('notes', '').lower():
-                        has_audio = True
-                    
-                    # Determine cost per second based on model and audio
-                    if 'fast' in model.lower():
-                        # Veo 3 Fast pricing
-                        cost_per_second = 0.40 if has_audio else 0.25
-                    else:
-                        # Standard Veo 3 pricing  
-                        cost_per_second = 0.75 if has_audio else 0.50
-                    
-                    estimated_cost = duration * cost_per_second
-                    total_cost += estimated_cost
-                
-                status['video_gen'] = {
-                    'status': f'🎬 {completed} Complete, {active} Active',
-                    'completed': completed,
-                    'active': active,
-                    'cost': total_cost,
-                    'health': 'healthy' if completed > 0 else 'warning'
-                }
-            except:
-                status['video_gen'] = {'status': '⚠️ Error', 'health': 'warning'}
-        else:
-            status['video_gen'] = {'status': '❌ No Jobs', 'health': 'critical'}
-        
-        # Pipeline Monitor Status
-        status['monitor'] = {
-            'status': '📊 Ready',
-            'refresh_rate': '5s',
-            'health': 'healthy'
-        }
-        
-        # Story Development Status
-        story_dir = self.project_root / "07_story_development"
-        if story_dir.exists():
-            story_files = list(story_dir.glob("*.md"))
-            status['story'] = {
-                'status': f'📚 {len(story_files)} Documents',
-                'files': len(story_files),
-                'health': 'healthy' if len(story_files) > 0 else 'warning'
+        if not ledger_path.exists():
+            return {'status': '❌ No Jobs', 'health': 'critical'}
+        try:
+            # Completion depends on the exports directory too, so it invalidates the cache
+            completed, active, total_cost = self._load_cached(
+                ledger_path, self._read_ledger, self.project_root / "04_flow_exports"
+            )
+            return {
+                'status': f'🎬 {completed} Complete, {active} Active',
+                'completed': completed,
+                'active': active,
+                'cost': total_cost,
+                'health': 'healthy' if completed > 0 else 'warning'
             }
-        else:
-            status['story'] = {'status': '❌ Missing', 'health': 'critical'}
-        
-        return status
+        except _STATUS_READ_ERRORS as e:
+            return {'status': f'⚠️ {type(e).__name__}', 'health': 'warning'}
+    
+    @staticmethod
+    def _count_story_docs(story_dir: Path) -> int:
+        """Number of markdown documents in the story directory"""
+        # Only the count is needed, so walk the dirents without building Paths
+        with os.scandir(story_dir) as it:
+            return sum(1 for e in it if e.name.endswith('.md') and e.is_file())
+    
+    def _story_status(self) -> Dict:
+        """Story Development status"""
+        story_dir = self.project_root / "07_story_development"
+        try:
+            # Adding or removing a document changes the directory's mtime
+            count = self._load_cached(story_dir, self._count_story_docs)
+        except (FileNotFoundError, NotADirectoryError):
+            return {'status': '❌ Missing', 'health': 'critical'}
+        return {
+            'status': f'📚 {count} Documents',
+            'files': count,
+            'health': 'healthy' if count > 0 else 'warning'
+        }
+    
+    def _assemble_status(self, styleframes: Dict, video_gen: Dict, story: Dict) -> Dict[str, Dict]:
+        """Combine probe results with the checks that need no disk access"""
+        return {
+            'ai': {
+                'available': self._ai_available,
+                'status': '✅ Active' if self._ai_available else '⚠️ Not configured'
+            },
+            'styleframes': styleframes,
+            'video_gen': video_gen,
+            'monitor': {
+                'status': '📊 Ready',
+                'refresh_rate': '5s',
+                'health': 'healthy'
+            },
+            'story': story,
+        }
+    
+    def get_tool_status(self) -> Dict[str, Dict]:
+        """Get status of all tools (files are only re-parsed after they change)"""
+        return self._assemble_status(self._styleframes_status(), self._video_gen_status(), self._story_status())
+    
+    def _sources_signature(self):
+        """Stat signatures of every file and directory the status is derived from"""
+        return tuple(self._stat_signature(path) for path in (
+            self.project_root / "01_styleframes_midjourney" / "styleframes_metadata.json",
+            self.project_root / "02_prompts" / "ledger.jsonl",
+            self.project_root / "04_flow_exports",
+            self.project_root / "07_story_development",
+        ))
+    
+    async def get_tool_status_async(self) -> Dict[str, Dict]:
+        """Get status of all tools, running the independent disk probes concurrently"""
+        # Nothing on disk changed since the last refresh: skip the probes entirely
+        signature = self._sources_signature()
+        if self._last_probes is not None and self._last_probes[0] == signature:
+            return self._assemble_status(*self._last_probes[1])
+        
+        probes = await asyncio.gather(
+            asyncio.to_thread(self._styleframes_status),
+            asyncio.to_thread(self._video_gen_status),
+            asyncio.to_thread(self._story_status),
+        )
+        self._last_probes = (signature, probes)
+        return self._assemble_status(*probes)
+    
+    # Tool card bodies as static markup pieces and (key, default, style, format) slots
+    _CARD_SEGMENTS = {
+        'styleframes': (
+            "🔥 Status: ", ('status', '❓ Unknown', '', '{}'),
+            "\n🎭 Scenes: ", ('scenes', 0, 'bold yellow', '{}'),
+            " | 🖼️ Frames: ", ('frames', 0, 'bold magenta', '{}'),
+            """
+[dim italic]Interactive workflow • Auto optimization[/dim italic]
+[bold cyan]🤖 AI Enhancement Available![/bold cyan]
+[bold green on black] 🚀 Press 'S' to launch! 🚀 [/bold green on black]""",
+        ),
+        'video_gen': (
+            "⚡ Status: ", ('status', '❓ Unknown', '', '{}'),
+            "\n✅ Completed: ", ('completed', 0, 'bold green', '{}'),
+            " | 💰 Est: ", ('cost', 0, 'bold red', '${:.2f}'),
+            """
+[dim italic]Veo 3 via Gemini API[/dim italic]
+[bold cyan]🤖 AI Prompt Enhancement![/bold cyan]
+[dim yellow]💡 Fast: $2/video, Standard: $4/video (+audio doubles cost)[/dim yellow]
+[bold green on black] 🎥 Press 'V' to generate! 🎥 [/bold green on black]""",
+        ),
+        'monitor': (
+            "🎯 Status: ", ('status', '❓ Unknown', '', '{}'),
+            "\n🔄 Refresh: ", ('refresh_rate', '5s', 'bold cyan', '{}'),
+            """ | 📈 Real-time Dashboard
+[dim italic]Live monitoring & diagnostics[/dim italic]
+[bold green on black] 📊 Press 'M' to monitor! 📊 [/bold green on black]""",
+        ),
+        'story': (
+            """[bold yellow]📚🎭 Story Development 🎭📚[/bold yellow]
+            
+📖 Status: """, ('status', '❓ Unknown', '', '{}'),
+            "\n📄 Files: ", ('files', 0, 'bold cyan', '{}'),
+            """
+🎬 Acts: [bold magenta]3 (Complete)[/bold magenta]
+
+[dim italic]📝 Scene breakdowns
+🎯 Production notes
+⚡ 4-minute trailer plan[/dim italic]
+
+[bold green on black] 📚 Press 'D' to view docs! 📚 [/bold green on black]""",
+        ),
+    }
+    
+    def _card_body(self, card: str, values: Dict) -> Text:
+        """Assemble a tool card body from its pre-parsed static pieces and current values"""
+        parts = self._card_parts.get(card)
+        if parts is None:
+            # Markup is parsed once per piece, not once per frame
+            parts = self._card_parts[card] = [
+                Text.from_markup(segment) if isinstance(segment, str) else segment
+                for segment in self._CARD_SEGMENTS[card]
+            ]
+        
+        body = Text()
+        for part in parts:
+            if isinstance(part, Text):
+                body.append_text(part)
+            else:
+                key, default, style, fmt = part
+                body.append(fmt.format(values.get(key, default)), style=style or None)
+        return body
     
     def create_tool_cards(self, status: Dict) -> Columns:
         """Create beautiful tool status cards"""
@@ -204,11 +495,7 @@ class StormlightControl:
         # Styleframe Manager Card
         sf_status = status.get('styleframes', {})
         sf_card = Panel(
-            f"""🔥 Status: {sf_status.get('status', '❓ Unknown')}
-🎭 Scenes: [bold yellow]{sf_status.get('scenes', 0)}[/bold yellow] | 🖼️ Frames: [bold magenta]{sf_status.get('frames', 0)}[/bold magenta]
-[dim italic]Interactive workflow • Auto optimization[/dim italic]
-[bold cyan]🤖 AI Enhancement Available![/bold cyan]
-[bold green on black] 🚀 Press 'S' to launch! 🚀 [/bold green on black]""",
+            self._card_body('styleframes', sf_status),
             title="🎨 Styleframes 🎨",
             border_style="bright_cyan" if sf_status.get('health') == 'healthy' else "bright_yellow",
             width=38,
@@ -219,12 +506,7 @@ class StormlightControl:
         # Video Generation Card
         vg_status = status.get('video_gen', {})
         vg_card = Panel(
-            f"""⚡ Status: {vg_status.get('status', '❓ Unknown')}
-✅ Completed: [bold green]{vg_status.get('completed', 0)}[/bold green] | 💰 Est: [bold red]${vg_status.get('cost', 0):.2f}[/bold red]
-[dim italic]Veo 3 via Gemini API[/dim italic]
-[bold cyan]🤖 AI Prompt Enhancement![/bold cyan]
-[dim yellow]💡 Fast: $2/video, Standard: $4/video (+audio doubles cost)[/dim yellow]
-[bold green on black] 🎥 Press 'V' to generate! 🎥 [/bold green on black]""",
+            self._card_body('video_gen', vg_status),
             title="🎬 Video Gen 🎬",
             border_style="bright_magenta" if vg_status.get('health') == 'healthy' else "bright_yellow",
             width=38,
@@ -235,10 +517,7 @@ class StormlightControl:
         # Pipeline Monitor Card
         pm_status = status.get('monitor', {})
         pm_card = Panel(
-            f"""🎯 Status: {pm_status.get('status', '❓ Unknown')}
-🔄 Refresh: [bold cyan]{pm_status.get('refresh_rate', '5s')}[/bold cyan] | 📈 Real-time Dashboard
-[dim italic]Live monitoring & diagnostics[/dim italic]
-[bold green on black] 📊 Press 'M' to monitor! 📊 [/bold green on black]""",
+            self._card_body('monitor', pm_status),
             title="📊 Monitor 📊",
             border_style="bright_blue",
             width=38,
@@ -249,17 +528,7 @@ class StormlightControl:
         # Story Development Card
         story_status = status.get('story', {})
         story_card = Panel(
-            f"""[bold yellow]📚🎭 Story Development 🎭📚[/bold yellow]
-            
-📖 Status: {story_status.get('status', '❓ Unknown')}
-📄 Files: [bold cyan]{story_status.get('files', 0)}[/bold cyan]
-🎬 Acts: [bold magenta]3 (Complete)[/bold magenta]
-
-[dim italic]📝 Scene breakdowns
-🎯 Production notes
-⚡ 4-minute trailer plan[/dim italic]
-
-[bold green on black] 📚 Press 'D' to view docs! 📚 [/bold green on black]""",
+            self._card_body('story', story_status),
             title="📚 Story 📚",
             border_style="bright_yellow",
             width=38,
@@ -269,39 +538,60 @@ class StormlightControl:
         
         return Columns(cards, equal=True, expand=True)
     
+    # Quick stats as (label, (status section, key, default, style, format)) pairs, two per row
+    _STATS_ROWS = (
+        (("🎬 Videos Generated", ('video_gen', 'completed', 0, 'bold green', '{}')),
+         ("🎨 Styleframes", ('styleframes', 'frames', 0, 'bold magenta', '{}'))),
+        (("💰 Est. Cost", ('video_gen', 'cost', 0, 'bold red', '${:.2f}')),
+         ("📝 Scenes", ('styleframes', 'scenes', 0, 'bold yellow', '{}'))),
+        (("⚡ Active Jobs", ('video_gen', 'active', 0, 'bold cyan', '{}')),
+         ("🤖 AI Status", ('ai', 'status', '❓ Unknown', 'bold cyan', '{}'))),
+    )
+    
     def create_quick_stats(self, status: Dict) -> Panel:
         """Create quick stats overview"""
-        vg_status = status.get('video_gen', {})
-        sf_status = status.get('styleframes', {})
-        ai_status = status.get('ai', {})
-        
+        if self._stats_panel is None:
+            self._stats_panel, self._stats_cells = self._build_quick_stats()
+        
+        # The table and panel are reused; only the value cells change
+        for cell, (section, key, default, style, fmt) in self._stats_cells:
+            cell.plain = fmt.format(status.get(section, {}).get(key, default))
+            # Style the value itself, not the padding the table adds around it
+            cell.spans = [Span(0, len(cell), style)]
+        return self._stats_panel
+    
+    def _build_quick_stats(self):
+        """Build the stats panel once, returning it with its value cells"""
         stats_table = Table(show_header=False, box=None, padding=(0, 2))
         stats_table.add_column("Metric", style="bold")
         stats_table.add_column("Value", style="cyan")
         stats_table.add_column("Metric", style="bold")
         stats_table.add_column("Value", style="cyan")
         
-        stats_table.add_row(
-            "🎬 Videos Generated", f"[bold green]{vg_status.get('completed', 0)}[/bold green]",
-            "🎨 Styleframes", f"[bold magenta]{sf_status.get('frames', 0)}[/bold magenta]"
-        )
-        stats_table.add_row(
-            "💰 Est. Cost", f"[bold red]${vg_status.get('cost', 0):.2f}[/bold red]",
-            "📝 Scenes", f"[bold yellow]{sf_status.get('scenes', 0)}[/bold yellow]"
-        )
-        stats_table.add_row(
-            "⚡ Active Jobs", f"[bold cyan]{vg_status.get('active', 0)}[/bold cyan]",
-            "🤖 AI Status", f"[bold cyan]{ai_status.get('status', '❓ Unknown')}[/bold cyan]"
-        )
+        cells = []
+        for row in self._STATS_ROWS:
+            renderables = []
+            for label, spec in row:
+                cell = Text()
+                cells.append((cell, spec))
+                renderables += [label, cell]
+            stats_table.add_row(*renderables)
         
-        return Panel(
+        panel = Panel(
             stats_table,
             title="📈 Production Overview",
             border_style="bright_green",
             padding=(0, 1)  # Reduce padding
         )
+        return panel, cells
     
     def create_controls_panel(self) -> Panel:
+        """Return the controls panel (built once, it never changes)"""
+        if self._controls_panel is None:
+            self._controls_panel = self._build_controls_panel()
+        return self._controls_panel
+    
+    def _build_controls_panel(self) -> Panel:
         """Create colorful controls and navigation panel"""
         controls_text = Text()
         controls_text.append("🎮✨ CONTROLS ✨🎮\n", style="bold cyan")  # Removed extra \n
@@ -328,39 +618,59 @@ class StormlightControl:
             padding=(0, 1)  # Reduce padding
         )
     
-    def create_main_layout(self) -> Layout:
+    def create_main_layout(self, status: Optional[Dict] = None) -> Layout:
         """Create the main dashboard layout with adaptive sizing"""
-        status = self.get_tool_status()
+        if status is None:
+            status = self.get_tool_status()
         
         # Check terminal size for responsive design
-        term_width, term_height = self.console.size
+        term_width, term_height = self._terminal_size()
         
         # Calculate 90% height usage
         content_height = int(term_height * 0.9)
         padding_total = term_height - content_height
         top_padding = padding_total
         
+        # The layout tree is static; only the sizes and the status-driven children change
+        if self._layout is None:
+            self._layout = self._build_layout_skeleton()
+        layout, tools, stats, top, main = self._layout
+        
+        # Tool cards
+        tools.update(self.create_tool_cards(status))
+        
+        # Stats row - more compact
+        stats.update(self.create_quick_stats(status))
+        
+        # Responsive layout using 90% of terminal height
+        top.size = top_padding
+        main.size = content_height
+        
+        return layout
+    
+    def _build_layout_skeleton(self):
+        """Build the dashboard layout tree once, returning it with its updatable parts"""
         # Adaptive layout
         layout = Layout()
         
         # Header with logo
-        header = Panel(
-            Align.center(self.create_ascii_logo()),
-            style="bold cyan",
-            padding=(0, 0)  # No padding
-        )
-        
-        # Tool cards
-        tool_cards = self.create_tool_cards(status)
-        
-        # Stats and controls row - more compact
-        stats = self.create_quick_stats(status)
+        if self._header_panel is None:
+            self._header_panel = Panel(
+                Align.center(self.create_ascii_logo()),
+                style="bold cyan",
+                padding=(0, 0)  # No padding
+            )
+        header = self._header_panel
+        
+        # Tool cards and stats are filled in per refresh
+        tools = Layout(ratio=4, name="tools")   # Tool cards get most space
+        stats = Layout(name="stats")
         controls = self.create_controls_panel()
         
         # Create bottom section with tighter spacing
         bottom_layout = Layout()
         bottom_layout.split_row(
-            Layout(stats, name="stats"),
+            stats,
             Layout(controls, name="controls")
         )
         
@@ -371,7 +681,7 @@ class StormlightControl:
         # Remove minimum_size constraints to allow proper shrinking/expanding
         content_layout.split_column(
             Layout(header, ratio=3, name="header"),      # Logo gets more space
-            Layout(tool_cards, ratio=4, name="tools"),   # Tool cards get most space
+            tools,
             Layout(bottom_layout, ratio=2, name="bottom") # Controls/stats get less
         )
         
@@ -382,17 +692,38 @@ class StormlightControl:
             padding=(0, 0)
         )
         
-        # Create responsive layout using 90% of terminal height
+        # Top padding and main content, sized from the terminal height on each refresh
+        top = Layout()
+        main = Layout(main_panel)
         padded_layout = Layout()
-        padded_layout.split_column(
-            Layout(size=top_padding),  # Top padding
-            Layout(main_panel, size=content_height),  # Main content at 90% height
-        )
+        padded_layout.split_column(top, main)
         
         # Final layout with responsive sizing
         layout.add_split(padded_layout)
         
-        return layout
+        return layout, tools, stats, top, main
+    
+    async def _run_tool_command(self, cmd: List[str]) -> bool:
+        """Run a tool without blocking the event loop; True if it was interrupted with Ctrl+C"""
+        loop = asyncio.get_running_loop()
+        previous_handler = signal.getsignal(signal.SIGINT)
+        interrupted = []
+        try:
+            # Ctrl+C reaches the tool directly; the control center just notes it and carries on
+            loop.add_signal_handler(signal.SIGINT, interrupted.append, True)
+            handler_installed = True
+        except (NotImplementedError, RuntimeError):
+            # No loop signal handlers here (e.g. Windows); KeyboardInterrupt still applies
+            handler_installed = False
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(*cmd)
+            await proc.wait()
+        finally:
+            if handler_installed:
+                loop.remove_signal_handler(signal.SIGINT)
+                signal.signal(signal.SIGINT, previous_handler)
+        return bool(interrupted)
     
     async def launch_tool(self, tool: str):
         """Launch a specific tool"""
@@ -414,46 +745,90 @@ class StormlightControl:
                 
                 # Offer auto-detection or manual input
                 if Confirm.ask("🔍 Auto-detect next clip from story development?", default=True):
-                    try:
-                        subprocess.run(['python3', 'tools/styleframe_manager.py', 'interactive'])
-                    except KeyboardInterrupt:
+                    if await self._run_tool_command(['python3', 'tools/styleframe_manager.py', 'interactive']):
                         console.print("\n[green]✨ Returned to Control Center! ✨[/green]")
                 else:
                     scene = Prompt.ask("🎭 Scene name (e.g., 'title_sequence')", default="new_scene")
                     description = Prompt.ask("📝 Scene description", default="Your scene description here")
-                    try:
-                        subprocess.run(['python3', 'tools/styleframe_manager.py', 'interactive', scene, description])
-                    except KeyboardInterrupt:
+                    if await self._run_tool_command(['python3', 'tools/styleframe_manager.py', 'interactive', scene, description]):
                         console.print("\n[green]✨ Returned to Control Center! ✨[/green]")
             elif tool == 'V':
                 console.print("\n[bold yellow]🎬✨ Video Generator - Interactive Mode ✨🎬[/bold yellow]")
                 console.print("[dim]💡 Tip: Press Ctrl+C to return to Control Center![/dim]")
-                try:
-                    subprocess.run(['python3', 'tools/generate_veo3.py'])
-                except KeyboardInterrupt:
+                if await self._run_tool_command(['python3', 'tools/generate_veo3.py']):
                     console.print("\n[green]✨ Returned to Control Center! ✨[/green]")
             elif tool == 'D':
                 console.print("\n[yellow]Story Development Files:[/yellow]")
-                subprocess.run(commands[tool])
+                await self._run_tool_command(commands[tool])
                 console.print("\nUse your editor to view/edit story files in 07_story_development/")
             else:
-                subprocess.run(commands[tool])
+                await self._run_tool_command(commands[tool])
             
             console.print("\n[dim]Press Enter to return to Control Center...[/dim]")
             input()
     
+    def _render_frame(self, layout: Layout, width: int, height: int) -> str:
+        """Render a layout off-screen and return the ANSI output"""
+        self._frame_buffer.seek(0)
+        self._frame_buffer.truncate()
+        self._frame_console.size = (width, height)
+        self._frame_console.print(layout)
+        return self._frame_buffer.getvalue()
+    
+    def _terminal_size(self):
+        """Terminal size, only re-queried after a resize while the dashboard is running"""
+        size = self._term_size
+        if size is None:
+            size = self.console.size
+            if self._track_resize:
+                self._term_size = size
+        return size
+    
+    def _on_resize(self, signum, frame):
+        """SIGWINCH handler: drop the cached terminal size"""
+        self._term_size = None
+    
     async def run_interactive(self):
         """Run the interactive control center"""
+        previous_handler = None
+        if hasattr(signal, 'SIGWINCH'):  # Unix only
+            try:
+                previous_handler = signal.signal(signal.SIGWINCH, self._on_resize)
+                self._track_resize = True
+            except ValueError:
+                pass  # Not on the main thread; keep querying every frame
+        try:
+            await self._interactive_loop()
+        finally:
+            if self._track_resize:
+                signal.signal(signal.SIGWINCH, previous_handler)
+                self._track_resize = False
+                self._term_size = None
+    
+    async def _interactive_loop(self):
+        """Redraw the dashboard and dispatch keys until the user quits"""
         while True:
-            console.clear()
-            
             # Get terminal size
-            term_width, term_height = console.size
+            term_width, term_height = self._terminal_size()
             
             # Let Rich handle the layout naturally - no fixed height
             # The layout will expand to fill available space properly
-            layout = self.create_main_layout()
-            console.print(layout)
+            # Read status files in worker threads so the event loop stays free
+            status = await self.get_tool_status_async()
+            
+            # Only lay out and render again when the status or terminal size changed
+            frame_key = (term_width, term_height, status)
+            if self._last_frame is None or self._last_frame[0] != frame_key:
+                layout = self.create_main_layout(status)
+                self._last_frame = (frame_key, self._render_frame(layout, term_width, term_height))
+            frame = self._last_frame[1]
+            
+            # Redraw the whole frame in a single terminal write: hide the cursor,
+            # home it and erase below instead of a full clear, then show it for input
+            if console.is_terminal:
+                frame = "\x1b[?25l\x1b[H\x1b[J" + frame + "\x1b[?25h"
+            sys.stdout.write(frame)
+            sys.stdout.flush()
             
             # Get user input
             try:
@@ -491,7 +866,7 @@ def main():
     control = StormlightControl()
     
     try:
-        asyncio.run(control.run_interactive())
+        _run(control.run_interactive())
     except KeyboardInterrupt:
         console.print("\n[bold green]👋 Goodbye![/bold green]")
 